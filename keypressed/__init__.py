@@ -26,7 +26,7 @@
 # Author:             Pagliacii
 # Last Modified By:   Pagliacii
 # Created Date:       2021-03-15 14:36:17
-# Last Modified Date: 2021-08-01 10:19:48
+# Last Modified Date: 2026-10-19 18:32:23
 
 """keypressed.__init__"""
 
@@ -34,5 +34,7 @@ __version__ = "keypressed 0.2.2"
 
 from loguru import logger
 
-default_logger = logger
+from keypressed.tracing import Logger
+
+default_logger: Logger = Logger(logger)
 del logger
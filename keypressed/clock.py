@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:37:00
+# Last Modified Date: 2026-10-19 18:53:33
+
+"""
+Clocks schedule the timeout driven behaviour.
+
+The App, the KeySequence replay and the Listener ask a clock for the time and
+for their timers instead of using QTimer directly. QtClock runs in real time
+on the Qt event loop, while VirtualClock jumps straight to the next deadline,
+so hours of recorded or synthetic typing run through the same timeout logic
+in seconds.
+
+Delays are milliseconds like QTimer, the time is in seconds. Qt is only
+imported by QtClock, so the headless exporters don't load it.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from PySide6.QtCore import QObject
+
+
+class Timer(t.Protocol):
+    """A single shot timer, restarted by every start()"""
+
+    def start(self) -> None:
+        """Starts or restarts the timer"""
+
+    def stop(self) -> None:
+        """Stops the timer without calling back"""
+
+    def isActive(self) -> bool:  # pylint: disable=invalid-name
+        """Whether the timer was started and hasn't fired yet"""
+
+
+class Clock(t.Protocol):
+    """Tells the time and schedules the callbacks"""
+
+    def now(self) -> float:
+        """The current time in seconds"""
+
+    def single_shot(self, msec: int, callback: t.Callable[[], t.Any]) -> None:
+        """Calls the callback once after msec milliseconds"""
+
+    def timer(self, msec: int, callback: t.Callable[[], t.Any]) -> Timer:
+        """Creates a stopped timer calling back after msec milliseconds"""
+
+
+class QtClock:
+    """
+    The real-time clock, the timers run on the Qt event loop.
+
+    Args:
+        parent (QObject):
+            the parent of the created timers
+    """
+
+    def __init__(self, parent: t.Optional[QObject] = None) -> None:
+        self._parent: t.Optional[QObject] = parent
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def single_shot(self, msec: int, callback: t.Callable[[], t.Any]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from PySide6.QtCore import QTimer
+
+        QTimer.singleShot(msec, callback)
+
+    def timer(self, msec: int, callback: t.Callable[[], t.Any]) -> Timer:
+        # pylint: disable=import-outside-toplevel
+        from PySide6.QtCore import QTimer
+
+        timer: QTimer = QTimer(self._parent)
+        timer.setSingleShot(True)
+        timer.setInterval(msec)
+        timer.timeout.connect(callback)
+        return timer
+
+
+class VirtualTimer:
+    """A timer of the VirtualClock, see Timer"""
+
+    def __init__(
+        self, clock: VirtualClock, msec: int, callback: t.Callable[[], t.Any]
+    ) -> None:
+        self._clock: VirtualClock = clock
+        self._interval: float = msec / 1000
+        self._callback: t.Callable[[], t.Any] = callback
+        self._deadline: float = 0
+        self._active: bool = False
+        # Restarting only moves the deadline, the queued entry reschedules
+        # itself when it's due, so there is at most one entry per timer.
+        self._queued: bool = False
+
+    def start(self) -> None:
+        self._deadline = self._clock.now() + self._interval
+        self._active = True
+        if not self._queued:
+            self._queued = True
+            self._clock.schedule(self._deadline, self._fire)
+
+    def stop(self) -> None:
+        self._active = False
+
+    def isActive(self) -> bool:  # pylint: disable=invalid-name
+        return self._active
+
+    def _fire(self) -> None:
+        self._queued = False
+        if not self._active:
+            return
+        if self._clock.now() < self._deadline:
+            self._queued = True
+            self._clock.schedule(self._deadline, self._fire)
+            return
+        self._active = False
+        self._callback()
+
+
+class VirtualClock:
+    """
+    A clock which only moves when it's advanced.
+
+    Args:
+        start (float):
+            the initial time in seconds
+    """
+
+    def __init__(self, start: float = 0) -> None:
+        self._now: float = start
+        self._queue: t.List[t.Tuple[float, int, t.Callable, t.Tuple]] = []
+        # Keeps the callbacks of the same deadline in the scheduled order
+        self._counter: t.Iterator[int] = itertools.count()
+
+    def now(self) -> float:
+        return self._now
+
+    def schedule(
+        self, deadline: float, callback: t.Callable, *args: t.Any
+    ) -> None:
+        """Calls the callback with args at the deadline, in seconds"""
+        heapq.heappush(
+            self._queue, (deadline, next(self._counter), callback, args)
+        )
+
+    def single_shot(self, msec: int, callback: t.Callable[[], t.Any]) -> None:
+        self.schedule(self._now + msec / 1000, callback)
+
+    def timer(self, msec: int, callback: t.Callable[[], t.Any]) -> Timer:
+        return VirtualTimer(self, msec, callback)
+
+    def next_deadline(self) -> t.Optional[float]:
+        return self._queue[0][0] if self._queue else None
+
+    def run_next(self) -> bool:
+        """
+        Jumps to the next deadline and runs its callback.
+
+        Returns:
+            False if nothing was scheduled.
+        """
+        if not self._queue:
+            return False
+        deadline, _, callback, args = heapq.heappop(self._queue)
+        self._now = max(self._now, deadline)
+        callback(*args)
+        return True
+
+    def advance_to(self, when: float) -> None:
+        """Runs every callback due until the time, then moves to it"""
+        while self._queue and self._queue[0][0] <= when:
+            self.run_next()
+        self._now = max(self._now, when)
+
+    def advance(self, msec: float) -> None:
+        self.advance_to(self._now + msec / 1000)
+
+    def run(self, limit: t.Optional[int] = None) -> int:
+        """
+        Runs the callbacks until nothing is scheduled.
+
+        Args:
+            limit (int):
+                the maximum number of callbacks to run, for the callbacks which
+                schedule themselves again
+        Returns:
+            The number of callbacks run.
+        """
+        count: int = 0
+        while (limit is None or count < limit) and self.run_next():
+            count += 1
+        return count
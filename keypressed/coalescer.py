@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:08:12
+# Last Modified Date: 2026-10-19 18:50:57
+
+"""
+Coalesces bursts of identical events into a single summarized event.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+
+
+class EventCoalescer:
+    """
+    Merges identical symbols that arrive within an interval into one event.
+
+    Symbols are accumulated on the caller's thread and flushed by a small
+    worker thread once no identical symbol arrived for ``interval`` seconds,
+    or immediately when a different symbol comes in. A flushed event looks
+    like ``"scroll ↓ x5"``, or just the symbol when it arrived once.
+
+    The events are emitted with the lock held, so an event flushed by the
+    worker can't be overtaken by a flush() on another thread.
+    """
+
+    def __init__(
+        self, emit: t.Callable[[str], None], interval: float = 0.2
+    ) -> None:
+        self._emit: t.Callable[[str], None] = emit
+        self._interval: float = interval
+        self._cond: threading.Condition = threading.Condition()
+        self._symbol: str = ""
+        self._count: int = 0
+        self._deadline: float = 0.0
+        self._running: bool = False
+        self._worker: t.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts the flushing worker"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stops the flushing worker, pending events are emitted first"""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def add(self, symbol: str, times: int = 1) -> None:
+        """
+        Accumulates a symbol.
+
+        Args:
+            symbol (str):
+                the symbol to be coalesced
+            times (int):
+                how many times the symbol occurred
+        """
+        with self._cond:
+            now: float = time.monotonic()
+            if symbol == self._symbol and now < self._deadline:
+                self._count += times
+            else:
+                if flushed := self._take():
+                    self._emit(flushed)
+                self._symbol = symbol
+                self._count = times
+            self._deadline = now + self._interval
+            self._cond.notify()
+
+    def flush(self) -> None:
+        """Emits the pending event now, e.g. before an unrelated event"""
+        with self._cond:
+            if flushed := self._take():
+                self._emit(flushed)
+
+    def _take(self) -> str:
+        """Pops the pending summarized event, the lock must be held"""
+        if not self._symbol:
+            return ""
+        summary: str = self._symbol
+        if self._count > 1:
+            summary += f" x{self._count}"
+        self._symbol = ""
+        self._count = 0
+        return summary
+
+    def _run(self) -> None:
+        """Emits pending events once their deadline is reached"""
+        while True:
+            with self._cond:
+                while self._running:
+                    if not self._symbol:
+                        self._cond.wait()
+                        continue
+                    remaining: float = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if flushed := self._take():
+                    self._emit(flushed)
+                running: bool = self._running
+            if not running:
+                return
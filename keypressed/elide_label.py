@@ -26,7 +26,7 @@
 # Author:             Pagliacii
 # Last Modified By:   Pagliacii
 # Created Date:       2021-04-10 15:18:29
-# Last Modified Date: 2021-04-10 18:46:29
+# Last Modified Date: 2026-10-19 18:28:27
 
 """
 A custom QT Label that can elide long text automatically.
@@ -36,10 +36,23 @@ from __future__ import annotations
 
 import typing as t
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFontMetrics, QPaintEvent, QTextCursor, QTextDocument
+from PySide6.QtCore import QRect, QRectF, QSizeF, Qt
+from PySide6.QtGui import (
+    QAbstractTextDocumentLayout,
+    QFontMetrics,
+    QPainter,
+    QPaintEvent,
+    QPalette,
+    QTextCharFormat,
+    QTextCursor,
+    QTextDocument,
+    QTextLine,
+    QTextOption,
+)
 from PySide6.QtWidgets import QLabel, QWidget
 
+from keypressed.key_sequence import CLEAR, Edit
+
 
 class ElideLabel(QLabel):
     """
@@ -60,6 +73,14 @@ class ElideLabel(QLabel):
             super().__init__(parent=parent, f=f)
         self._elide_on_left: bool = elide_on_left
         self._elide_mark: str = elide_mark
+        # A persistent document updated by edits, see apply_edits
+        self._document: QTextDocument = QTextDocument(self)
+        self._document.setDocumentMargin(0)
+        self._document.setDefaultTextOption(QTextOption(Qt.AlignLeft))
+        self._cursor: QTextCursor = QTextCursor(self._document)
+        self._item_starts: t.List[int] = []
+        self._suffix_start: t.Optional[int] = None
+        self._incremental: bool = False
 
     def elide_text(self) -> None:
         """
@@ -93,7 +114,138 @@ class ElideLabel(QLabel):
 
         self.setText(rich_text)
 
+    def clear(self) -> None:
+        self._document.clear()
+        self._item_starts = []
+        self._suffix_start = None
+        self._incremental = False
+        super().clear()
+
+    def apply_edits(self, edits: t.Iterable[Edit], suffix: str = "") -> None:
+        """
+        Updates the persistent document by the edits of a key sequence.
+
+        Only the changed items are parsed and laid out again, instead of the
+        whole rich text.
+
+        Args:
+            edits (Iterable):
+                the edits taken from a key sequence
+            suffix (str):
+                a rich text shown after the items until the next update
+        """
+        if not self._incremental:
+            super().clear()
+            self._incremental = True
+        if self._document.defaultFont() != self.font():
+            self._document.setDefaultFont(self.font())
+        if self._suffix_start is not None:
+            self._remove_from(self._suffix_start)
+            self._suffix_start = None
+        for removed, item in edits:
+            if removed == CLEAR or removed >= len(self._item_starts) > 0:
+                self._remove_from(0)
+                self._item_starts = []
+            elif removed:
+                self._remove_from(self._item_starts[-removed])
+                del self._item_starts[-removed:]
+            if item:
+                self._item_starts.append(self._insert(item))
+        if suffix:
+            self._suffix_start = self._insert(suffix)
+        self.update()
+
+    def _remove_from(self, position: int) -> None:
+        self._cursor.setPosition(position)
+        self._cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+        self._cursor.removeSelectedText()
+
+    def _insert(self, html: str) -> int:
+        """Appends a rich text, returns where it starts"""
+        self._cursor.movePosition(QTextCursor.End)
+        start: int = self._cursor.position()
+        self._cursor.setCharFormat(QTextCharFormat())
+        stripped: str = html.lstrip(" ")
+        if (
+            stripped != html
+            and start > 0
+            and not self._document.characterAt(start - 1).isspace()
+        ):
+            # Leading whitespaces are dropped by insertHtml, and collapsed
+            # with the previous one like in HTML
+            self._cursor.insertText(" ")
+        self._cursor.insertHtml(stripped)
+        return start
+
+    def paint_document(self) -> None:
+        """Paints the persistent document, elided if it's too long"""
+        painter: QPainter = QPainter(self)
+        rect: QRect = self.contentsRect().adjusted(
+            self.margin(), self.margin(), -self.margin(), -self.margin()
+        )
+        size: QSizeF = self._document.size()
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(
+            QPalette.Text, self.palette().color(QPalette.WindowText)
+        )
+        top: float = rect.top() + (rect.height() - size.height()) / 2
+
+        if size.width() <= rect.width():
+            left: float = rect.left() + (rect.width() - size.width()) / 2
+            mark: str = ""
+        else:
+            # Keeps the end in view when eliding on left, or the start
+            mark = self._elide_mark
+            mark_width: int = QFontMetrics(self.font()).horizontalAdvance(mark)
+            # Clips at a character boundary so no glyph is cut in half
+            line: QTextLine = self._document.firstBlock().layout().lineAt(0)
+            if self._elide_on_left:
+                left = rect.right() - size.width()
+                pos: int = line.xToCursor(
+                    rect.left() + mark_width - left, QTextLine.CursorOnCharacter
+                )
+                boundary: float = left + line.cursorToX(pos + 1)[0]
+                painter.setClipRect(
+                    QRectF(
+                        boundary,
+                        rect.top(),
+                        rect.right() - boundary,
+                        rect.height(),
+                    )
+                )
+            else:
+                left = rect.left()
+                pos = line.xToCursor(
+                    rect.right() - mark_width - left,
+                    QTextLine.CursorOnCharacter,
+                )
+                boundary = left + line.cursorToX(pos)[0]
+                painter.setClipRect(
+                    QRectF(left, rect.top(), boundary - left, rect.height())
+                )
+
+        painter.save()
+        painter.translate(left, top)
+        self._document.documentLayout().draw(painter, context)
+        painter.restore()
+        if mark:
+            painter.setClipping(False)
+            painter.setFont(self.font())
+            painter.setPen(self.palette().color(QPalette.WindowText))
+            painter.drawText(
+                rect,
+                Qt.AlignVCenter
+                | (Qt.AlignLeft if self._elide_on_left else Qt.AlignRight),
+                mark,
+            )
+        painter.end()
+
     def paintEvent(self, event: QPaintEvent) -> None:
         # pylint: disable=invalid-name
+        if self._incremental:
+            # Draws the frame and the background only, the text is empty
+            super().paintEvent(event)
+            self.paint_document()
+            return
         self.elide_text()
         super().paintEvent(event)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:12:40
+# Last Modified Date: 2026-10-19 18:52:12
+
+"""
+Records pressed keys into an event log and reads them back.
+
+An event log is a JSON lines file, each line is a ``[timestamp, key]`` pair,
+where the key is the symbol emitted by the listener.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+from pathlib import Path
+
+Event = t.Tuple[float, str]
+
+
+class EventRecorder:
+    """
+    Appends every pressed key to an event log.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._file: t.TextIO = open(path, "a", encoding="utf-8")
+
+    def record(self, key: str) -> None:
+        self._file.write(json.dumps([time.time(), key]) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_events(path: Path) -> t.Iterator[Event]:
+    """
+    Reads an event log lazily.
+
+    Args:
+        path (Path):
+            the event log file
+    Returns:
+        An iterator of (timestamp, key) pairs, blank lines are skipped.
+    """
+    with open(path, encoding="utf-8") as log:
+        for line in log:
+            if not line.strip():
+                continue
+            timestamp, key = json.loads(line)
+            yield float(timestamp), str(key)
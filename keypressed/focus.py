@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:15:47
+# Last Modified Date: 2026-10-19 18:52:37
+
+"""
+Tracks the focused application and filters keys by application rules.
+
+Asking the window system for the focused window on every key is a round trip
+per keystroke, so a background thread keeps the focused application cached
+and refreshes it when the focus changes. X11 and Windows notify the focus
+changes, other platforms are polled at a low rate.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import platform
+import re
+import select
+import threading
+import typing as t
+from pathlib import Path
+
+from keypressed import default_logger
+
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import windll, wintypes
+
+
+class FocusTracker:
+    """
+    Keeps the name of the focused application up to date.
+
+    The name is the lowercase executable name on Windows (e.g. "code.exe"),
+    the WM_CLASS on X11 (e.g. "code") and the application name on macOS.
+    """
+
+    def __init__(self, poll_interval: float = 0.5, logger=None) -> None:
+        self.app: str = ""
+        self._poll_interval: float = poll_interval
+        self._running: threading.Event = threading.Event()
+        self._worker: t.Optional[threading.Thread] = None
+        self._thread_id: int = 0
+        self._logger = logger or default_logger
+
+    def start(self) -> None:
+        """Starts tracking in a background thread"""
+        if self._running.is_set():
+            return
+        self._running.set()
+        system: str = platform.system()
+        if system == "Windows":
+            target: t.Callable[[], None] = self._watch_windows
+        elif system == "Linux":
+            target = self._watch_x11
+        else:
+            target = self._poll
+        self._worker = threading.Thread(target=target, daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stops tracking"""
+        self._running.clear()
+        if self._thread_id:
+            # Breaks the message loop of the Windows watcher
+            windll.user32.PostThreadMessageW(self._thread_id, 0x0012, 0, 0)
+        if self._worker is not None:
+            self._worker.join(timeout=1)
+            self._worker = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the tracking thread is still running"""
+        return self._worker is not None and self._worker.is_alive()
+
+    def _update(self, app: str) -> None:
+        if app != self.app:
+            self._logger.debug("Focused application: {}", app)
+        self.app = app
+
+    def _poll(self) -> None:
+        """Polls the focused application on macOS and other platforms"""
+        query: t.Callable[[], str] = _frontmost_macos
+        while self._running.is_set():
+            try:
+                self._update(query())
+            except Exception as err:  # pylint: disable=broad-except
+                self._logger.warning("Polling the focused app failed: {}", err)
+                self._update("")
+                return
+            self._running.wait(self._poll_interval)
+
+    def _watch_x11(self) -> None:
+        """Refreshes on the _NET_ACTIVE_WINDOW changes of the root window"""
+        # pylint: disable=import-outside-toplevel
+        from Xlib import X, display, error
+
+        try:
+            disp = display.Display()
+        except Exception as err:  # pylint: disable=broad-except
+            self._logger.warning("No X display, app filter disabled: {}", err)
+            return
+        root = disp.screen().root
+        active_window = disp.intern_atom("_NET_ACTIVE_WINDOW")
+        root.change_attributes(event_mask=X.PropertyChangeMask)
+
+        def refresh() -> None:
+            try:
+                prop = root.get_full_property(active_window, X.AnyPropertyType)
+                if not prop or not prop.value[0]:
+                    self._update("")
+                    return
+                window = disp.create_resource_object("window", prop.value[0])
+                wm_class = window.get_wm_class() or ("", "")
+                self._update(wm_class[-1].lower())
+            except error.XError:
+                self._update("")
+
+        refresh()
+        while self._running.is_set():
+            readable, _, _ = select.select([disp], [], [], self._poll_interval)
+            if not readable:
+                continue
+            for _ in range(disp.pending_events()):
+                event = disp.next_event()
+                if (
+                    event.type == X.PropertyNotify
+                    and event.atom == active_window
+                ):
+                    refresh()
+        disp.close()
+
+    def _watch_windows(self) -> None:
+        """Refreshes on the EVENT_SYSTEM_FOREGROUND events"""
+        # pylint: disable=invalid-name
+        EVENT_SYSTEM_FOREGROUND = 0x0003
+        WINEVENT_OUTOFCONTEXT = 0x0000
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None,
+            wintypes.HANDLE,
+            wintypes.DWORD,
+            wintypes.HWND,
+            wintypes.LONG,
+            wintypes.LONG,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        )
+
+        def on_foreground(*_) -> None:
+            self._update(_foreground_windows())
+
+        # Keeps a reference to the callback, or it will be collected
+        callback = WinEventProc(on_foreground)
+        self._thread_id = windll.kernel32.GetCurrentThreadId()
+        hook = windll.user32.SetWinEventHook(
+            EVENT_SYSTEM_FOREGROUND,
+            EVENT_SYSTEM_FOREGROUND,
+            0,
+            callback,
+            0,
+            0,
+            WINEVENT_OUTOFCONTEXT,
+        )
+        self._update(_foreground_windows())
+        msg = wintypes.MSG()
+        while windll.user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+            windll.user32.TranslateMessage(ctypes.byref(msg))
+            windll.user32.DispatchMessageW(ctypes.byref(msg))
+        windll.user32.UnhookWinEvent(hook)
+        self._thread_id = 0
+
+
+def _foreground_windows() -> str:
+    """Gets the executable name of the foreground window on Windows"""
+    # pylint: disable=invalid-name
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    hwnd = windll.user32.GetForegroundWindow()
+    pid = wintypes.DWORD()
+    windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    process = windll.kernel32.OpenProcess(
+        PROCESS_QUERY_LIMITED_INFORMATION, False, pid.value
+    )
+    if not process:
+        return ""
+    try:
+        size = wintypes.DWORD(260)
+        buffer = ctypes.create_unicode_buffer(size.value)
+        if not windll.kernel32.QueryFullProcessImageNameW(
+            process, 0, buffer, ctypes.byref(size)
+        ):
+            return ""
+        return Path(buffer.value).name.lower()
+    finally:
+        windll.kernel32.CloseHandle(process)
+
+
+def _frontmost_macos() -> str:
+    """Gets the name of the frontmost application on macOS"""
+    # pylint: disable=import-outside-toplevel
+    from AppKit import NSWorkspace
+
+    app = NSWorkspace.sharedWorkspace().frontmostApplication()
+    return str(app.localizedName()).lower() if app else ""
+
+
+class AppFilter:
+    """
+    Decides whether keys typed into the focused application are shown.
+
+    The rules are glob patterns matched against the application name,
+    case-insensitively. Excluded applications are never shown, and when
+    there are included applications only those are shown.
+    """
+
+    def __init__(
+        self,
+        include: t.Sequence[str] = (),
+        exclude: t.Sequence[str] = (),
+        tracker: t.Optional[FocusTracker] = None,
+        logger=None,
+    ) -> None:
+        self.tracker: FocusTracker = tracker or FocusTracker(logger=logger)
+        self._include: t.Optional[t.Pattern] = _compile(include)
+        self._exclude: t.Optional[t.Pattern] = _compile(exclude)
+        # The verdicts per application, there are only a few of them
+        self._verdicts: t.Dict[str, bool] = {}
+        self._logger = logger or default_logger
+        self._warned: bool = False
+
+    def start(self) -> None:
+        self.tracker.start()
+
+    def stop(self) -> None:
+        self.tracker.stop()
+
+    def allowed(self) -> bool:
+        """Checks the cached focused application against the rules"""
+        app: str = self.tracker.app
+        if self._exclude and (not app or not self.tracker.alive):
+            # Fails closed, an excluded app may be focused
+            if not self._warned:
+                self._warned = True
+                self._logger.warning(
+                    "The focused application is unknown, keys are hidden"
+                )
+            return False
+        verdict: t.Optional[bool] = self._verdicts.get(app)
+        if verdict is None:
+            verdict = self.match(app)
+            self._verdicts[app] = verdict
+        return verdict
+
+    def match(self, app: str) -> bool:
+        """Checks an application name against the rules"""
+        if self._exclude and self._exclude.match(app):
+            return False
+        if self._include:
+            return bool(self._include.match(app))
+        return True
+
+
+def _compile(patterns: t.Sequence[str]) -> t.Optional[t.Pattern]:
+    """Compiles glob patterns into a single regular expression"""
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(pattern.lower()) for pattern in patterns)
+    )
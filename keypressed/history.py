@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:20:54
+# Last Modified Date: 2026-10-19 18:53:15
+
+"""
+A scrollback panel of the past key sequences.
+"""
+
+from __future__ import annotations
+
+import time
+import typing as t
+from collections import deque
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRectF,
+    Qt,
+)
+from PySide6.QtGui import (
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPaintEvent,
+    QResizeEvent,
+    QTextDocument,
+)
+from PySide6.QtWidgets import QAbstractScrollArea, QWidget
+
+Index = t.Union[QModelIndex, QPersistentModelIndex]
+
+
+class HistoryModel(QAbstractListModel):
+    """
+    Keeps the last max_size key sequences, the newest at the first row.
+    """
+
+    def __init__(
+        self, max_size: int = 10000, parent: t.Optional[QObject] = None
+    ) -> None:
+        super().__init__(parent)
+        self._bursts: t.Deque[t.Tuple[float, str]] = deque(maxlen=max_size)
+
+    def rowCount(self, parent: Index = QModelIndex()) -> int:
+        # pylint: disable=invalid-name
+        return 0 if parent.isValid() else len(self._bursts)
+
+    def data(self, index: Index, role: int = Qt.DisplayRole) -> t.Any:
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        timestamp, text = self._bursts[-1 - index.row()]
+        return (
+            f'<span style="color: gray;">'
+            f'{time.strftime("%H:%M:%S", time.localtime(timestamp))}</span> '
+            f"{text}"
+        )
+
+    def append(self, text: str) -> None:
+        """Adds a key sequence as the first row, drops the oldest if full"""
+        if len(self._bursts) == self._bursts.maxlen:
+            last: int = len(self._bursts) - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self._bursts.popleft()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._bursts.append((time.time(), text))
+        self.endInsertRows()
+
+
+class HistoryPanel(QAbstractScrollArea):
+    """
+    A scrollback view of the past key sequences.
+
+    Rows have a uniform height and the scroll bar counts rows, so both
+    updating and painting only touch the visible rows. QListView lays out
+    every row when rows are inserted, which is too slow for long histories.
+    """
+
+    def __init__(
+        self,
+        font: QFont,
+        max_size: int = 10000,
+        title: str = "History",
+        parent: t.Optional[QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.history: HistoryModel = HistoryModel(max_size, self)
+        self.history.rowsInserted.connect(self.handle_rows_inserted)
+        self.history.rowsRemoved.connect(self.update_scroll_bar)
+        self.setFont(font)
+        self._row_height: int = QFontMetrics(font).height()
+        self.setWindowTitle(title)
+        self.resize(800, 600)
+
+    def append(self, text: str) -> None:
+        self.history.append(text)
+
+    def visible_rows(self) -> int:
+        return max(1, self.viewport().height() // self._row_height)
+
+    def handle_rows_inserted(
+        self, _parent: QModelIndex, first: int, last: int
+    ) -> None:
+        self.update_scroll_bar()
+        # Keeps the same rows in view if the history was scrolled down
+        value: int = self.verticalScrollBar().value()
+        if value > 0 and first <= value:
+            self.verticalScrollBar().setValue(value + last - first + 1)
+
+    def update_scroll_bar(self) -> None:
+        visible: int = self.visible_rows()
+        self.verticalScrollBar().setRange(
+            0, max(0, self.history.rowCount() - visible)
+        )
+        self.verticalScrollBar().setPageStep(visible)
+        self.viewport().update()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        # pylint: disable=invalid-name
+        super().resizeEvent(event)
+        self.update_scroll_bar()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        # pylint: disable=invalid-name
+        painter: QPainter = QPainter(self.viewport())
+        width: int = self.viewport().width()
+        first: int = self.verticalScrollBar().value()
+        last: int = min(
+            self.history.rowCount(), first + self.visible_rows() + 1
+        )
+        doc: QTextDocument = QTextDocument()
+        doc.setDocumentMargin(0)
+        doc.setDefaultFont(self.font())
+        clip: QRectF = QRectF(0, 0, width, self._row_height)
+        for row in range(first, last):
+            doc.setHtml(self.history.data(self.history.index(row)))
+            painter.save()
+            painter.translate(0, (row - first) * self._row_height)
+            doc.drawContents(painter, clip)
+            painter.restore()
+        painter.end()
@@ -26,7 +26,7 @@
 # Author:             Pagliacii
 # Last Modified By:   Pagliacii
 # Created Date:       2021-04-10 17:57:19
-# Last Modified Date: 2021-04-14 15:49:24
+# Last Modified Date: 2026-10-19 18:44:54
 
 """Contains all pressed keys."""
 
@@ -34,9 +34,15 @@ from __future__ import annotations
 
 import string
 import typing as t
+from collections import deque
 from functools import partial
 
 from keypressed import default_logger
+from keypressed.clock import Timer, VirtualClock
+
+# An edit of the items, (how many items to remove, the item to append)
+Edit = t.Tuple[int, str]
+CLEAR: int = -1
 
 
 class KeySequence:
@@ -45,13 +51,38 @@ class KeySequence:
     """
 
     def __init__(
-        self, font_size: int = 16, max_same_key: int = 3, logger=None
+        self,
+        font_size: int = 16,
+        max_same_key: int = 3,
+        max_keys: t.Optional[int] = None,
+        max_period: int = 4,
+        min_repeats: int = 3,
+        track_edits: bool = False,
+        logger=None,
     ) -> None:
-        self._sequence: t.List[str] = []
+        # Only the last max_keys keys are kept when it's given
+        self._sequence: t.Deque[str] = deque(maxlen=max_keys)
         self._last_pressed_key: str = ""
         self._pressed_times: int = 0
         self._additional = partial(self.additional_text, font_size)
+        self._repeated = partial(self.pattern_text, font_size)
         self._max_same_key: int = max_same_key
+        # A pattern of 2 to max_period keys is collapsed into "(jk)×N" after
+        # it was repeated min_repeats times. The recent keys whose items are
+        # the tail of the sequence are kept to detect it, the window is
+        # bounded so the detection costs constant time per key.
+        self._max_period: int = max_period
+        self._min_repeats: int = min_repeats
+        self._recent_keys: t.Deque[str] = deque(
+            maxlen=max(1, max_period * min_repeats)
+        )
+        self._pattern: t.Tuple[str, ...] = ()
+        self._pattern_html: str = ""
+        self._pattern_times: int = 0
+        self._pattern_progress: int = 0
+        # Lets a view update its document instead of re-parsing everything
+        self._edits: t.Optional[t.List[Edit]] = [] if track_edits else None
+        self._removed: int = 0
         self._logger = logger or default_logger
 
     def __str__(self) -> str:
@@ -60,28 +91,139 @@ class KeySequence:
     def additional_text(self, size: int, num: int) -> str:
         return f'<span style="font-size: {size}px;">...{num}x </span>'
 
+    def pattern_text(self, size: int, pattern: str, num: int) -> str:
+        return (
+            f" ({pattern})"
+            f'<span style="font-size: {size}px;">\u00d7{num} </span>'
+        )
+
     def accept(self, key: str) -> None:
+        default_logger.record(
+            "accept", key, self._last_pressed_key, self._pressed_times
+        )
+        # The sequence is passed as is, it's converted only if DEBUG is enabled
         self._logger.debug(
-            f"KeySequence = {self}, Last Key = {self._last_pressed_key}, "
-            f"Pressed: {self._pressed_times}, New Key = {key}"
+            "KeySequence = {}, Last Key = {}, Pressed: {}, New Key = {}",
+            self,
+            self._last_pressed_key,
+            self._pressed_times,
+            key,
         )
+        if self._pattern and self.continue_pattern(key):
+            return
         if key != self._last_pressed_key:
             self._pressed_times = 1
-            self._sequence.append(self.padding_whitespace(key))
+            self.append_item(self.padding_whitespace(key))
             self._last_pressed_key = key
         elif self._pressed_times < self._max_same_key:
             self._pressed_times += 1
-            self._sequence.append(key)
+            self.append_item(key)
         else:
             if self._pressed_times > self._max_same_key:
-                self._sequence.pop()
+                self.pop_item()
             self._pressed_times += 1
-            self._sequence.append(self._additional(self._pressed_times))
+            self.append_item(self._additional(self._pressed_times))
+            # The tail doesn't match the recent keys one to one anymore
+            self._recent_keys.clear()
+            return
+        self._recent_keys.append(key)
+        self.detect_pattern()
+
+    def detect_pattern(self) -> None:
+        """Collapses the tail if it's a pattern repeated min_repeats times"""
+        recent: t.List[str] = list(self._recent_keys)
+        for period in range(2, self._max_period + 1):
+            length: int = period * self._min_repeats
+            if len(recent) < length or length > len(self._sequence):
+                break
+            pattern: t.List[str] = recent[-period:]
+            # Runs of one key are left to max_same_key, the other shorter
+            # periods were checked first, so the pattern is primitive
+            if pattern.count(pattern[0]) == period:
+                continue
+            if recent[-length:] != pattern * self._min_repeats:
+                continue
+            items: t.List[str] = [self.pop_item() for _ in range(length)]
+            self._pattern = tuple(pattern)
+            self._pattern_html = "".join(reversed(items[:period])).strip()
+            self._pattern_times = self._min_repeats
+            self._pattern_progress = 0
+            self.append_item(
+                self._repeated(self._pattern_html, self._pattern_times)
+            )
+            self._recent_keys.clear()
+            return
+
+    def continue_pattern(self, key: str) -> bool:
+        """
+        Accepts a key if it continues the collapsed pattern.
+
+        Returns:
+            False if the key breaks the pattern.
+        """
+        if key != self._pattern[self._pattern_progress]:
+            # The keys of the partial repetition become ordinary keys
+            self._recent_keys.extend(self._pattern[: self._pattern_progress])
+            self._pattern = ()
+            return False
+
+        if key == self._last_pressed_key:
+            self._pressed_times += 1
+            item: str = key
+        else:
+            self._pressed_times = 1
+            item = self.padding_whitespace(key)
+            self._last_pressed_key = key
+        self._pattern_progress += 1
+        if self._pattern_progress < len(self._pattern):
+            self.append_item(item)
+            return True
+
+        # A whole repetition, replaces the partial keys and the pattern
+        for _ in range(len(self._pattern)):
+            self.pop_item()
+        self._pattern_times += 1
+        self._pattern_progress = 0
+        self.append_item(
+            self._repeated(self._pattern_html, self._pattern_times)
+        )
+        return True
+
+    def append_item(self, item: str) -> None:
+        self._sequence.append(item)
+        if self._edits is not None:
+            self._edits.append((self._removed, item))
+            self._removed = 0
+
+    def pop_item(self) -> str:
+        if self._edits is not None:
+            self._removed += 1
+        return self._sequence.pop()
+
+    def take_edits(self) -> t.List[Edit]:
+        """
+        Takes the edits since the last call, only when track_edits is set.
+
+        Every edit removes the last N items of the sequence, then appends an
+        item if it isn't empty. N is CLEAR when the sequence was cleared.
+        """
+        edits: t.List[Edit] = self._edits or []
+        if self._removed:
+            edits.append((self._removed, ""))
+            self._removed = 0
+        if self._edits is not None:
+            self._edits = []
+        return edits
 
     def clear(self) -> None:
-        self._sequence = []
+        self._sequence.clear()
+        if self._edits is not None:
+            self._edits = [(CLEAR, "")]
+            self._removed = 0
         self._last_pressed_key = ""
         self._pressed_times = 0
+        self._recent_keys.clear()
+        self._pattern = ()
 
     def padding_whitespace(self, key: str) -> str:
         if len(key) > 1:
@@ -100,3 +242,88 @@ class KeySequence:
                 # and normal key
                 key = " " + key
         return key
+
+
+def replay(
+    events: t.Iterable[t.Tuple[float, str]],
+    sequence: KeySequence,
+    timeout: int = 3000,
+) -> t.Iterator[t.Tuple[float, str]]:
+    """
+    Replays timestamped keys through a key sequence, like the App does.
+
+    Args:
+        events (Iterable):
+            (timestamp, key) pairs in chronological order
+        sequence (KeySequence):
+            the key sequence accepting the keys
+        timeout (int):
+            milliseconds of idle time before the sequence is cleared
+    Returns:
+        An iterator of (timestamp, text) states, each state lasts until the
+        next one. An empty text means the sequence was cleared.
+    """
+    clock: t.Optional[VirtualClock] = None
+    cleared: t.List[float] = []
+
+    def handle_timeout() -> None:
+        sequence.clear()
+        cleared.append(clock.now())
+
+    timer: t.Optional[Timer] = None
+    for timestamp, key in events:
+        if clock is None:
+            clock = VirtualClock(timestamp)
+            timer = clock.timer(timeout, handle_timeout)
+        clock.advance_to(timestamp)
+        if cleared:
+            yield cleared.pop(), ""
+        sequence.accept(key)
+        yield timestamp, str(sequence)
+        timer.start()
+    if clock is not None:
+        clock.run()
+        yield cleared.pop(), ""
+
+
+class KeySequenceLanes:
+    """
+    Contains one key sequence per host, the most recently active at the bottom.
+    """
+
+    def __init__(
+        self,
+        font_size: int = 16,
+        max_same_key: int = 3,
+        max_lanes: int = 4,
+        logger=None,
+    ) -> None:
+        self._lanes: t.Dict[str, KeySequence] = {}
+        self._font_size: int = font_size
+        self._max_same_key: int = max_same_key
+        self._max_lanes: int = max_lanes
+        self._logger = logger or default_logger
+
+    def __str__(self) -> str:
+        return "<br>".join(
+            f'<span style="font-size: {self._font_size}px;">{host}</span> '
+            f"{sequence}"
+            for host, sequence in self._lanes.items()
+        )
+
+    def accept(self, host: str, key: str) -> None:
+        sequence: t.Optional[KeySequence] = self._lanes.pop(host, None)
+        if sequence is None:
+            sequence = KeySequence(
+                font_size=self._font_size,
+                max_same_key=self._max_same_key,
+                logger=self._logger,
+            )
+        sequence.accept(key)
+        # Re-inserts to keep the lanes ordered by the last activity
+        self._lanes[host] = sequence
+        if len(self._lanes) > self._max_lanes:
+            del self._lanes[next(iter(self._lanes))]
+
+    def clear(self) -> None:
+        self._lanes = {}
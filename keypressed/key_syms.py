@@ -26,7 +26,7 @@
 # Author:             Pagliacii
 # Last Modified By:   Pagliacii
 # Created Date:       2021-03-17 22:06:42
-# Last Modified Date: 2021-04-12 17:14:38
+# Last Modified Date: 2026-10-19 18:43:49
 
 """
 Special key symbol mappings.
@@ -39,6 +39,7 @@ import typing as t
 from collections import defaultdict
 
 from pynput import keyboard as kbd
+from pynput import mouse
 
 # Replace symbols
 mod_symbols: t.Dict[str, t.DefaultDict[str, str]] = {
@@ -111,6 +112,21 @@ modifier_keys: t.Dict[kbd.Key, str] = {
     kbd.Key.shift_r: mod_symbols["shift"][system],
 }
 
+# Mouse buttons
+mouse_buttons: t.Dict[mouse.Button, str] = {
+    mouse.Button.left: "\U0001f5b1L",
+    mouse.Button.middle: "\U0001f5b1M",
+    mouse.Button.right: "\U0001f5b1R",
+}
+
+# Scroll directions, keyed by the sign of (dx, dy)
+scroll_directions: t.Dict[t.Tuple[int, int], str] = {
+    (0, 1): "scroll \u2191",
+    (0, -1): "scroll \u2193",
+    (-1, 0): "scroll \u2190",
+    (1, 0): "scroll \u2192",
+}
+
 # Navigation keys
 navigation_keys: t.Dict[kbd.Key, str] = {
     # Arrow keys
@@ -127,18 +143,16 @@ navigation_keys: t.Dict[kbd.Key, str] = {
 }
 
 # All special keys
-special_keys: t.Dict[kbd.Key, str] = (
-    {
-        kbd.Key.esc: "Esc",
-        kbd.Key.menu: "\u25a4",
-        kbd.Key.pause: "Pause",
-        kbd.Key.print_screen: "PrtScn",
-        kbd.Key.space: "\u2423",
-    }
-    | enter_and_editing_keys
-    | function_keys
-    | lock_keys
-    | media_keys
-    | modifier_keys
-    | navigation_keys
-)
+special_keys: t.Dict[kbd.Key, str] = {
+    kbd.Key.esc: "Esc",
+    kbd.Key.menu: "\u25a4",
+    kbd.Key.pause: "Pause",
+    kbd.Key.print_screen: "PrtScn",
+    kbd.Key.space: "\u2423",
+    **enter_and_editing_keys,
+    **function_keys,
+    **lock_keys,
+    **media_keys,
+    **modifier_keys,
+    **navigation_keys,
+}
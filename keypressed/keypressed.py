@@ -26,7 +26,7 @@
 # Author:             Pagliacii
 # Last Modified By:   Pagliacii
 # Created Date:       2021-03-15 14:38:05
-# Last Modified Date: 2021-08-04 18:16:39
+# Last Modified Date: 2026-10-19 18:51:48
 
 
 """
@@ -35,6 +35,7 @@ Display pressed keys the on screen and hide automatically after a timeout.
 
 from __future__ import annotations
 
+import typing as t
 from pathlib import Path
 
 from PySide6.QtCore import QObject, QPoint, QRect, Qt, QTimer
@@ -48,9 +49,17 @@ from PySide6.QtWidgets import (
 )
 
 from keypressed import __version__, default_logger
+from keypressed.clock import Clock, QtClock, Timer
 from keypressed.elide_label import ElideLabel
-from keypressed.key_sequence import KeySequence
+from keypressed.event_log import EventRecorder
+from keypressed.focus import AppFilter
+from keypressed.history import HistoryPanel
+from keypressed.key_sequence import Edit, KeySequence, KeySequenceLanes
 from keypressed.listener import Listener
+from keypressed.network import Publisher, RemoteListener
+from keypressed.overlay import OverlayManager
+from keypressed.shortcuts import ShortcutMatcher
+from keypressed.tracing import Watchdog
 from keypressed.utils import escape_characters
 
 
@@ -92,6 +101,41 @@ class Fonts(QObject):
         return font
 
 
+def create_label(
+    font: QFont, background_color: str, font_color: str, margin: int
+) -> ElideLabel:
+    """
+    Creates the label showing the key sequence.
+
+    Args:
+        font (QFont):
+            the font of the label
+        background_color (str):
+            the background color of the label
+        font_color (str):
+            the text color of the label
+        margin (int):
+            the margin of the label
+    Returns:
+        A styled label.
+    """
+    label: ElideLabel = ElideLabel(elide_on_left=True)
+    label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
+    label.setFont(font)
+    label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+    label.setStyleSheet(
+        f"background-color: {background_color}; color: {font_color};"
+    )
+    label.setTextFormat(Qt.RichText)
+    label.setTextInteractionFlags(Qt.NoTextInteraction)
+    label.setMargin(margin)
+    return label
+
+
+# Where the overlay is shown, see App
+_screen_modes: t.Tuple[str, ...] = ("primary", "all", "mouse")
+
+
 class App(QApplication):
     """
     The main application
@@ -107,39 +151,67 @@ class App(QApplication):
         font_size: int = 64,
         margin: int = 8,
         opacity: float = 0.5,
+        show_mouse: bool = False,
         timeout: int = 3000,
         title: str = "Keypressed",
+        publish_to: t.Optional[t.Tuple[str, int]] = None,
+        aggregate_on: t.Optional[int] = None,
+        compress: bool = False,
+        record_to: t.Optional[Path] = None,
+        include_apps: t.Sequence[str] = (),
+        exclude_apps: t.Sequence[str] = (),
+        binding_packs: t.Sequence[Path] = (),
+        history_size: int = 0,
+        screens: str = "primary",
+        clock: t.Optional[Clock] = None,
         logger=None,
         **kwargs,
     ) -> None:
+        if screens not in _screen_modes:
+            raise ValueError(
+                f"Unknown screens {screens!r}, expected one of {_screen_modes}"
+            )
         super().__init__(*args, **kwargs)
         self._logger = logger or default_logger
+        # A VirtualClock runs the timeouts without waiting for them
+        self.clock: Clock = clock or QtClock(self)
         self.setQuitOnLastWindowClosed(False)
 
         self.title: str = title
-        self.window: QMainWindow = QMainWindow()
-        self.window.setWindowTitle(self.title)
-        self.window.setWindowFlags(
-            Qt.FramelessWindowHint | Qt.Tool | Qt.WindowStaysOnTopHint
-        )
-        self.window.setWindowOpacity(opacity)
-        self.setActiveWindow(self.window)
 
         self.font: QFont = Fonts.font(font_name, font_size)
         self.font.setWeight(QFont.Bold)
-        self.label: ElideLabel = ElideLabel(elide_on_left=True)
-        self.label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        self.label.setFont(self.font)
-        self.label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.label.setStyleSheet(
-            f"background-color: {background_color}; color: {font_color};"
+        # Shows a lane per remote host when aggregating
+        self._rows: int = 1 if aggregate_on is None else 2
+        if self._rows > 1:
+            self.font.setPixelSize(font_size // self._rows)
+        self.label: ElideLabel = create_label(
+            self.font, background_color, font_color, margin
         )
-        self.label.setTextFormat(Qt.RichText)
-        self.label.setTextInteractionFlags(Qt.NoTextInteraction)
-        self.label.setMargin(margin)
-        self.window.setCentralWidget(self.label)
 
-        self.place()
+        # "primary" shows the overlay in a window on the primary screen, "all"
+        # on every screen and "mouse" on the screen with the mouse
+        self.window: t.Optional[QMainWindow] = None
+        self.overlays: t.Optional[OverlayManager] = None
+        if screens == "primary":
+            self.window = QMainWindow()
+            self.window.setWindowTitle(self.title)
+            self.window.setWindowFlags(
+                Qt.FramelessWindowHint | Qt.Tool | Qt.WindowStaysOnTopHint
+            )
+            self.window.setWindowOpacity(opacity)
+            self.setActiveWindow(self.window)
+            self.window.setCentralWidget(self.label)
+            self.place()
+        else:
+            self.overlays = OverlayManager(
+                self.label,
+                self.title,
+                opacity,
+                rows=self._rows,
+                follow_mouse=screens == "mouse",
+                logger=self._logger,
+            )
 
         self.tray: QSystemTrayIcon = QSystemTrayIcon()
         self.tray.setToolTip(__version__)
@@ -147,59 +219,161 @@ class App(QApplication):
         self.tray.setVisible(True)
 
         self.menu: QMenu = QMenu()
+        # An optional scrollback of the past key sequences
+        self.history: t.Optional[HistoryPanel] = None
+        if history_size > 0:
+            history_font: QFont = QFont(self.font)
+            history_font.setPixelSize(font_size // 2)
+            self.history = HistoryPanel(
+                history_font, history_size, title=f"{self.title} History"
+            )
+            history_action: QAction = self.menu.addAction("&History")
+            history_action.triggered.connect(self.history.show)
+        trace_action: QAction = self.menu.addAction("Dump &Trace")
+        trace_action.triggered.connect(lambda: default_logger.dump())
         quit_action: QAction = self.menu.addAction("&Quit")
         quit_action.triggered.connect(self.exit_app)
         self.tray.setContextMenu(self.menu)
 
-        self.listener: Listener = Listener(self._logger)
-        self.listener.key_pressed.connect(self.show_keys)
+        self.listener: t.Union[Listener, RemoteListener]
+        self._sequence: t.Union[KeySequence, KeySequenceLanes]
+        if aggregate_on is None:
+            app_filter: t.Optional[AppFilter] = None
+            if include_apps or exclude_apps:
+                app_filter = AppFilter(
+                    include_apps, exclude_apps, logger=self._logger
+                )
+            self.listener = Listener(
+                self._logger,
+                mouse_enabled=show_mouse,
+                app_filter=app_filter,
+                clock=self.clock,
+            )
+            self.listener.key_pressed.connect(self.show_keys)
+            self._sequence = KeySequence(
+                font_size=font_size // 2, track_edits=True, logger=self._logger
+            )
+        else:
+            self.listener = RemoteListener(aggregate_on, logger=self._logger)
+            self.listener.keys_received.connect(self.show_remote_keys)
+            self._sequence = KeySequenceLanes(
+                font_size=font_size // 4, logger=self._logger
+            )
 
-        self.timer: QTimer = QTimer(self)
-        self.timer.setInterval(timeout)
-        self.timer.timeout.connect(self.handle_timeout)
+        # Only the locally pressed keys are published
+        self.publisher: t.Optional[Publisher] = None
+        if publish_to is not None and aggregate_on is None:
+            self.publisher = Publisher(
+                publish_to, compress=compress, logger=self._logger
+            )
+            self.listener.key_pressed.connect(self.publisher.publish)
 
-        self._sequence: KeySequence = KeySequence(
-            font_size=font_size // 2, logger=self._logger
-        )
+        self.recorder: t.Optional[EventRecorder] = None
+        if record_to is not None and aggregate_on is None:
+            self.recorder = EventRecorder(record_to)
+            self.listener.key_pressed.connect(self.recorder.record)
+
+        self._command_size: int = font_size // 2
+        self.shortcuts: t.Optional[ShortcutMatcher] = None
+        if binding_packs:
+            self.shortcuts = ShortcutMatcher.load(
+                binding_packs, logger=self._logger
+            )
+
+        self.timer: Timer = self.clock.timer(timeout, self.handle_timeout)
+
+        # Dumps the flight recorder if the Qt loop stops beating
+        self.watchdog: Watchdog = Watchdog(default_logger)
+        self.heartbeat: QTimer = QTimer(self)
+        self.heartbeat.setInterval(500)
+        self.heartbeat.timeout.connect(self.watchdog.beat)
 
     def place(self) -> None:
+        if self.window is None:
+            return
         screen: QScreen = QApplication.primaryScreen()
         rect: QRect = QScreen.availableGeometry(screen)
         width: int = rect.size().width()
         height: int = rect.size().height()
-        self.window.setFixedSize(width, 0.125 * height)
-        self.label.setFixedSize(width, 0.125 * height)
+        window_height: float = 0.125 * self._rows * height
+        self.window.setFixedSize(width, window_height)
+        self.label.setFixedSize(width, window_height)
 
         geo: QRect = self.window.frameGeometry()
         center: QPoint = rect.center()
         geo.moveCenter(center)
-        self.window.move(geo.topLeft().x(), 13 / 16 * height)
+        self.window.move(geo.topLeft().x(), 15 / 16 * height - window_height)
+
+    def show_overlay(self) -> None:
+        if self.window is not None:
+            self.window.setVisible(True)
+        elif self.overlays is not None:
+            self.overlays.show()
+
+    def hide_overlay(self) -> None:
+        if self.window is not None:
+            self.window.setVisible(False)
+        elif self.overlays is not None:
+            self.overlays.hide()
 
     def show_keys(self, key: str) -> None:
         self._sequence.accept(escape_characters(key))
+        suffix: str = ""
+        if self.shortcuts and (command := self.shortcuts.accept(key)):
+            suffix = (
+                f' <span style="font-size: {self._command_size}px;">'
+                f"\u2192 {escape_characters(command)}</span>"
+            )
+        edits: t.List[Edit] = self._sequence.take_edits()
+        self.label.apply_edits(edits, suffix)
+        default_logger.record("edits", edits, suffix)
+        self._logger.debug("Label edits: {}", edits)
+        self.show_overlay()
+        self.timer.start()
+
+    def show_remote_keys(self) -> None:
+        # All the keys received meanwhile are shown by a single update
+        for host, key in self.listener.take_keys():
+            self._sequence.accept(
+                escape_characters(host), escape_characters(key)
+            )
+            default_logger.record("remote", host, key)
         self.label.clear()
         self.label.setText(str(self._sequence))
-        self._logger.debug(f"Label: {self.label.text()}")
-        self.window.setVisible(True)
+        self._logger.opt(lazy=True).debug("Label: {}", self.label.text)
+        self.show_overlay()
         self.timer.start()
 
     def run(self) -> None:
         # Run the main Qt loop
         self._logger.info("Starting...")
         self.label.setText(f"{self.title} is launching...")
-        QTimer.singleShot(800, self.handle_timeout)
-        self.window.setVisible(True)
+        self.clock.single_shot(800, self.handle_timeout)
+        self.show_overlay()
         self.listener.start()
+        self.heartbeat.start()
+        self.watchdog.start()
+        if self.publisher is not None:
+            self.publisher.start()
         self._logger.info("Running...")
 
     def exit_app(self) -> None:
         self._logger.info("See ya!")
         self.listener.stop()
+        self.watchdog.stop()
+        if self.publisher is not None:
+            self.publisher.stop()
+        if self.recorder is not None:
+            self.recorder.close()
         self.quit()
 
     def handle_timeout(self) -> None:
+        if self.history is not None and (text := str(self._sequence)):
+            self.history.append(text)
         self.label.clear()
         self._sequence.clear()
-        QTimer.singleShot(10, lambda: self.window.setVisible(False))
+        if self.shortcuts:
+            self.shortcuts.reset()
+        self.clock.single_shot(10, self.hide_overlay)
         if self.timer.isActive():
             self.timer.stop()
@@ -26,21 +26,34 @@
 # Author:             Pagliacii
 # Last Modified By:   Pagliacii
 # Created Date:       2021-03-17 22:05:17
-# Last Modified Date: 2021-07-31 11:56:08
+# Last Modified Date: 2026-10-19 18:44:54
 
 """
-Listening in the background, emit a Qt signal when a key was pressed.
+Listening in the background, emit a Qt signal when a key was pressed or the
+mouse was clicked or scrolled.
 """
 
 from __future__ import annotations
 
 import string
 import typing as t
+from functools import partial
 
 from pynput import keyboard as kbd
+from pynput import mouse
 from PySide6.QtCore import QThread, Signal
 
-from keypressed.key_syms import modifier_keys, special_keys
+from keypressed import default_logger
+from keypressed.clock import Clock, QtClock
+from keypressed.coalescer import EventCoalescer
+from keypressed.event_log import Event
+from keypressed.focus import AppFilter
+from keypressed.key_syms import (
+    modifier_keys,
+    mouse_buttons,
+    scroll_directions,
+    special_keys,
+)
 from keypressed.utils import char_from_vk, is_shift_key
 
 
@@ -51,25 +64,82 @@ class Listener(QThread):
 
     key_pressed: Signal = Signal(str)
 
-    def __init__(self, logger) -> None:
+    def __init__(
+        self,
+        logger,
+        mouse_enabled: bool = False,
+        coalesce: float = 0.2,
+        app_filter: t.Optional[AppFilter] = None,
+        clock: t.Optional[Clock] = None,
+    ) -> None:
         super().__init__()
         # A listener to monitor all key pressed or released events
         self.kbd_listener = kbd.Listener(
             on_press=self.on_press, on_release=self.on_release
         )
+        # Mouse motion isn't listened to at all, clicks and scroll ticks are
+        # coalesced on the capture thread before reaching Qt.
+        self.mouse_listener: t.Optional[mouse.Listener] = None
+        self._mouse_events: EventCoalescer = EventCoalescer(
+            self.key_pressed.emit, interval=coalesce
+        )
+        if mouse_enabled:
+            self.mouse_listener = mouse.Listener(
+                on_click=self.on_click, on_scroll=self.on_scroll
+            )
+        # Only an in-memory lookup per key, the focused app is cached
+        self._app_filter: t.Optional[AppFilter] = app_filter
         self._combinations: t.Dict[kbd.Key, str] = {}
         self._logger = logger
+        self._clock: Clock = clock or QtClock(self)
 
     def run(self) -> None:
         """The main processing logic of a thread"""
+        if self._app_filter is not None:
+            self._app_filter.start()
         self.kbd_listener.start()
+        if self.mouse_listener is not None:
+            self._mouse_events.start()
+            self.mouse_listener.start()
+            self.mouse_listener.wait()
         self.kbd_listener.wait()
 
     def stop(self) -> None:
         """Stops a running thread"""
         self.kbd_listener.stop()
+        if self.mouse_listener is not None:
+            self.mouse_listener.stop()
+            self._mouse_events.stop()
+        if self._app_filter is not None:
+            self._app_filter.stop()
         super().quit()
 
+    def replay(self, events: t.Iterable[Event]) -> None:
+        """
+        Emits recorded or synthetic keys, keeping the gaps between them.
+
+        The next key is scheduled on the clock only after the previous one
+        was emitted, so a long session doesn't queue up all its keys at once.
+
+        Args:
+            events (Iterable):
+                (timestamp, key) pairs in chronological order
+        """
+        iterator: t.Iterator[Event] = iter(events)
+
+        def emit_next(key: t.Optional[str], last: float) -> None:
+            if key is not None:
+                default_logger.record("key", key)
+                self.key_pressed.emit(key)
+            if (event := next(iterator, None)) is not None:
+                timestamp, next_key = event
+                delay: float = 0 if key is None else timestamp - last
+                self._clock.single_shot(
+                    round(delay * 1000), partial(emit_next, next_key, timestamp)
+                )
+
+        emit_next(None, 0)
+
     def on_press(self, key: t.Union[kbd.Key, kbd.KeyCode, None]) -> None:
         """Key pressed handler"""
         key_sym: str = ""
@@ -109,11 +179,44 @@ class Listener(QThread):
                 self._combinations[key] = special_keys.get(key, key.name)
             else:
                 key_sym = special_keys.get(key, key.name)
-        if key_sym:
-            self._logger.debug(f"{key_sym} emitted")
+        if key_sym and self.allowed():
+            # A click or scroll before the key is shown before it
+            self._mouse_events.flush()
+            default_logger.record("key", key_sym)
+            self._logger.debug("{} emitted", key_sym)
             self.key_pressed.emit(key_sym)
 
+    def allowed(self) -> bool:
+        """Checks whether the focused application passes the app filter"""
+        return self._app_filter is None or self._app_filter.allowed()
+
     def on_release(self, key: t.Union[kbd.Key, kbd.KeyCode, None]) -> None:
         """Key released handler"""
         if key in self._combinations:
             self._combinations.pop(key)
+
+    def on_click(
+        self, _x: int, _y: int, button: mouse.Button, pressed: bool
+    ) -> None:
+        """Mouse clicked handler"""
+        if not pressed or button not in mouse_buttons or not self.allowed():
+            return
+        modifiers: str = "".join(self._combinations.values())
+        self._mouse_events.add(modifiers + mouse_buttons[button])
+
+    def on_scroll(self, _x: int, _y: int, dx: int, dy: int) -> None:
+        """Mouse scrolled handler"""
+        # Prefers the vertical direction when both axes were scrolled
+        if dy:
+            direction: t.Tuple[int, int] = (0, 1 if dy > 0 else -1)
+        elif dx:
+            direction = (1 if dx > 0 else -1, 0)
+        else:
+            return
+        if not self.allowed():
+            return
+        modifiers: str = "".join(self._combinations.values())
+        self._mouse_events.add(
+            modifiers + scroll_directions[direction],
+            times=max(1, int(abs(dy or dx))),
+        )
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:10:23
+# Last Modified Date: 2026-10-19 18:51:48
+
+"""
+Publishes key events to a central aggregator over TCP.
+
+Every frame on the wire is a 5 bytes header, the payload length (uint32) and
+the flags (uint8), followed by a JSON payload which may be zlib compressed::
+
+    {"host": "presenter-1", "events": [[1626312000.25, "Ctrl+c"], ...]}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import socket
+import struct
+import threading
+import time
+import typing as t
+import zlib
+from collections import deque
+
+from PySide6.QtCore import QThread, Signal
+
+from keypressed import default_logger
+from keypressed.event_log import Event
+
+_header: struct.Struct = struct.Struct(">IB")
+FLAG_COMPRESSED: int = 0x01
+MAX_FRAME_SIZE: int = 1 << 20
+
+Handler = t.Callable[[str, t.List[Event]], None]
+
+
+def encode_batch(host: str, events: t.List[Event], compress: bool) -> bytes:
+    """
+    Encodes a batch of key events into a frame.
+
+    Args:
+        host (str):
+            the host tag of the publisher
+        events (list):
+            a list of (timestamp, key) pairs
+        compress (bool):
+            compress the payload with zlib or not
+    Returns:
+        A frame ready to be sent.
+    """
+    payload: bytes = json.dumps(
+        {"host": host, "events": events}, separators=(",", ":")
+    ).encode("utf-8")
+    flags: int = 0
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= FLAG_COMPRESSED
+    return _header.pack(len(payload), flags) + payload
+
+
+def decode_batch(flags: int, payload: bytes) -> t.Tuple[str, t.List[Event]]:
+    """
+    Decodes a frame payload.
+
+    Args:
+        flags (int):
+            the flags from the frame header
+        payload (bytes):
+            the frame payload
+    Returns:
+        The host tag and a list of (timestamp, key) pairs.
+    Raises:
+        ValueError: if the payload isn't a valid batch
+    """
+    if flags & FLAG_COMPRESSED:
+        # The decompressed payload is bounded like the compressed one
+        decompressor = zlib.decompressobj()
+        payload = decompressor.decompress(payload, MAX_FRAME_SIZE)
+        if decompressor.unconsumed_tail:
+            raise ValueError("oversized payload")
+        if not decompressor.eof:
+            raise ValueError("truncated payload")
+    data: t.Any = json.loads(payload)
+    if not isinstance(data, dict) or not isinstance(data.get("events"), list):
+        raise ValueError("malformed batch")
+    events: t.List[Event] = []
+    for event in data["events"]:
+        if not isinstance(event, list) or len(event) != 2:
+            raise ValueError(f"malformed event {event!r}")
+        ts, key = event
+        if not isinstance(ts, (int, float)) or not isinstance(key, str):
+            raise ValueError(f"malformed event {event!r}")
+        events.append((float(ts), key))
+    return str(data.get("host", "")), events
+
+
+class Publisher:
+    """
+    Sends key events to an aggregator in batches, in a background thread.
+
+    Pending events are kept in a bounded queue, when the aggregator can't keep
+    up the newest events are dropped instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        address: t.Tuple[str, int],
+        name: t.Optional[str] = None,
+        batch_size: int = 64,
+        interval: float = 0.05,
+        compress: bool = False,
+        max_pending: int = 4096,
+        logger=None,
+    ) -> None:
+        self._address: t.Tuple[str, int] = address
+        self._name: str = name or socket.gethostname()
+        self._batch_size: int = batch_size
+        self._interval: float = interval
+        self._compress: bool = compress
+        self._pending: queue.Queue = queue.Queue(max_pending)
+        self._running: threading.Event = threading.Event()
+        # Set when stop() gives up flushing, interrupts a blocked send
+        self._aborted: threading.Event = threading.Event()
+        self._sock: t.Optional[socket.socket] = None
+        self._worker: t.Optional[threading.Thread] = None
+        self._logger = logger or default_logger
+        self.dropped: int = 0
+
+    def start(self) -> None:
+        """Starts the sending thread"""
+        if self._running.is_set():
+            return
+        self._running.set()
+        self._aborted.clear()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float = 2) -> None:
+        """
+        Stops the sending thread, pending events are flushed first.
+
+        Args:
+            timeout (float):
+                the seconds to flush, then the pending events are dropped and
+                a blocked send is interrupted
+        """
+        self._running.clear()
+        if self._worker is None:
+            return
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            self._logger.warning("The aggregator isn't reading, stops anyway")
+            self._aborted.set()
+            if (sock := self._sock) is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            # Connecting takes 5 seconds at most, sending fails at once
+            self._worker.join()
+        self._worker = None
+
+    def publish(self, key: str) -> None:
+        """Queues a key event, it's safe to be called from any thread"""
+        try:
+            self._pending.put_nowait((time.time(), key))
+        except queue.Full:
+            self.dropped += 1
+            self._logger.debug("Publisher queue is full, {} dropped", key)
+
+    def _collect(self) -> t.List[Event]:
+        """Waits for an event, then gathers a batch until it's full or due"""
+        try:
+            events: t.List[Event] = [self._pending.get(timeout=self._interval)]
+        except queue.Empty:
+            return []
+        deadline: float = time.monotonic() + self._interval
+        while len(events) < self._batch_size:
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                events.append(self._pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return events
+
+    def _connect(self) -> t.Optional[socket.socket]:
+        """Connects to the aggregator, retries until stopped"""
+        while True:
+            try:
+                sock: socket.socket = socket.create_connection(
+                    self._address, timeout=5
+                )
+                # The timeout is only for connecting, sending blocks
+                sock.settimeout(None)
+                return sock
+            except OSError as err:
+                self._logger.warning(
+                    "Connecting to {}:{} failed: {}", *self._address, err
+                )
+                if not self._running.is_set() or self._aborted.is_set():
+                    return None
+                time.sleep(1)
+
+    def _run(self) -> None:
+        """The main processing logic of the sending thread"""
+        sock: t.Optional[socket.socket] = None
+        while not self._aborted.is_set() and (
+            self._running.is_set() or not self._pending.empty()
+        ):
+            events: t.List[Event] = self._collect()
+            if not events:
+                continue
+            if sock is None:
+                if (sock := self._connect()) is None:
+                    break
+                self._sock = sock
+            try:
+                # Blocks when the aggregator stops reading, which keeps
+                # the kernel buffers bounded
+                sock.sendall(encode_batch(self._name, events, self._compress))
+            except OSError as err:
+                self._logger.warning(
+                    "Sending {} events failed: {}", len(events), err
+                )
+                sock.close()
+                sock = self._sock = None
+        if sock is not None:
+            sock.close()
+            self._sock = None
+
+
+class Aggregator:
+    """
+    Receives key events from many publishers and hands them to a handler.
+
+    Each connection owns a bounded queue of decoded batches. When it's full
+    the connection stops reading, so the backpressure goes all the way back
+    to the publisher through TCP.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        max_pending: int = 64,
+        logger=None,
+    ) -> None:
+        self._handler: Handler = handler
+        self._host: str = host
+        self.port: int = port
+        self._max_pending: int = max_pending
+        self._logger = logger or default_logger
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
+        self._closing: t.Optional[asyncio.Event] = None
+        self._ready: threading.Event = threading.Event()
+        self._worker: t.Optional[threading.Thread] = None
+
+    def serve(self) -> None:
+        """Serves until stopped, blocks the calling thread"""
+        asyncio.run(self._serve())
+
+    def start(self) -> None:
+        """Serves in a background thread, returns once it's listening"""
+        self._worker = threading.Thread(target=self.serve, daemon=True)
+        self._worker.start()
+        self._ready.wait()
+
+    def stop(self) -> None:
+        """Stops serving and closes all connections"""
+        if self._loop is not None and self._closing is not None:
+            self._loop.call_soon_threadsafe(self._closing.set)
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._closing = asyncio.Event()
+        server = await asyncio.start_server(
+            self._handle, self._host, self.port, limit=MAX_FRAME_SIZE
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self._logger.info("Aggregating on {}:{}", self._host, self.port)
+        self._ready.set()
+        async with server:
+            await self._closing.wait()
+        self._ready.clear()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        peer = writer.get_extra_info("peername")
+        batches: asyncio.Queue = asyncio.Queue(self._max_pending)
+        delivering: asyncio.Task = asyncio.create_task(self._deliver(batches))
+        try:
+            while True:
+                length, flags = _header.unpack(
+                    await reader.readexactly(_header.size)
+                )
+                if length > MAX_FRAME_SIZE:
+                    self._logger.warning("Oversized frame from {}", peer)
+                    break
+                payload: bytes = await reader.readexactly(length)
+                await batches.put(decode_batch(flags, payload))
+        except asyncio.IncompleteReadError:
+            pass
+        except (OSError, ValueError, TypeError, zlib.error) as err:
+            self._logger.warning("Dropping {}: {}", peer, err)
+        finally:
+            await batches.join()
+            delivering.cancel()
+            writer.close()
+
+    async def _deliver(self, batches: asyncio.Queue) -> None:
+        while True:
+            host, events = await batches.get()
+            try:
+                self._handler(host, events)
+            except Exception as err:  # pylint: disable=broad-except
+                # Keeps delivering, or the connection would wait forever
+                self._logger.warning("Handling a batch failed: {}", err)
+            finally:
+                batches.task_done()
+
+
+class RemoteListener(QThread):
+    """
+    Like the Listener, but hands the keys received by an aggregator to Qt.
+
+    The keys are queued per host and keys_received is emitted only when the
+    GUI has taken the previous ones, so a slow GUI never piles up signals.
+    When a host sends faster than the GUI takes, its oldest keys are dropped,
+    the overlay only shows the latest ones anyway.
+    """
+
+    keys_received: Signal = Signal()
+
+    def __init__(
+        self,
+        port: int,
+        host: str = "0.0.0.0",
+        max_pending: int = 256,
+        logger=None,
+    ) -> None:
+        super().__init__()
+        self.aggregator: Aggregator = Aggregator(
+            self.handle_events, host=host, port=port, logger=logger
+        )
+        self._max_pending: int = max_pending
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: t.Dict[str, t.Deque[str]] = {}
+        self._notified: bool = False
+
+    def run(self) -> None:
+        """The main processing logic of a thread"""
+        self.aggregator.serve()
+
+    def stop(self) -> None:
+        """Stops a running thread"""
+        self.aggregator.stop()
+        super().quit()
+
+    def handle_events(self, host: str, events: t.List[Event]) -> None:
+        with self._lock:
+            keys: t.Optional[t.Deque[str]] = self._pending.get(host)
+            if keys is None:
+                keys = self._pending[host] = deque(maxlen=self._max_pending)
+            keys.extend(key for _, key in events)
+            notify: bool = not self._notified
+            self._notified = True
+        if notify:
+            self.keys_received.emit()
+
+    def take_keys(self) -> t.List[t.Tuple[str, str]]:
+        """
+        Takes the received keys, called by the GUI on keys_received.
+
+        Returns:
+            (host, key) pairs, in the order received per host.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._notified = False
+        return [(host, key) for host, keys in pending.items() for key in keys]
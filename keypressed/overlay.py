@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:30:25
+# Last Modified Date: 2026-10-19 18:53:33
+
+"""
+Shows the key overlay on several screens at once.
+
+The label is rendered once per update into a cached pixmap for every
+distinct overlay size and device pixel ratio, then the pixmap is drawn by the
+overlay window of each screen.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from PySide6.QtCore import QObject, QSize, Qt
+from PySide6.QtGui import (
+    QCursor,
+    QGuiApplication,
+    QPainter,
+    QPaintEvent,
+    QPixmap,
+    QScreen,
+)
+from PySide6.QtWidgets import QWidget
+
+from keypressed.elide_label import ElideLabel
+
+
+class OverlayCache:
+    """
+    Renders the label into pixmaps, until the label was changed.
+    """
+
+    def __init__(self, label: ElideLabel) -> None:
+        self._label: ElideLabel = label
+        self._pixmaps: t.Dict[t.Tuple[int, int, float], QPixmap] = {}
+
+    def invalidate(self) -> None:
+        self._pixmaps.clear()
+
+    def pixmap(self, size: QSize, ratio: float) -> QPixmap:
+        """
+        Gets the rendered label of a size and a device pixel ratio.
+
+        Args:
+            size (QSize):
+                the size of the overlay in device independent pixels
+            ratio (float):
+                the device pixel ratio of the screen
+        Returns:
+            The rendered label.
+        """
+        key: t.Tuple[int, int, float] = (size.width(), size.height(), ratio)
+        pixmap: t.Optional[QPixmap] = self._pixmaps.get(key)
+        if pixmap is None:
+            if self._label.size() != size:
+                self._label.setFixedSize(size)
+            pixmap = QPixmap(size * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            self._label.render(pixmap)
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+
+class OverlayWindow(QWidget):
+    """
+    A frameless window at the bottom of a screen, draws the cached pixmap.
+    """
+
+    def __init__(
+        self,
+        screen: QScreen,
+        cache: OverlayCache,
+        title: str,
+        opacity: float,
+        rows: int = 1,
+    ) -> None:
+        super().__init__()
+        self._cache: OverlayCache = cache
+        self._rows: int = rows
+        self.setWindowTitle(title)
+        self.setWindowFlags(
+            Qt.FramelessWindowHint | Qt.Tool | Qt.WindowStaysOnTopHint
+        )
+        self.setWindowOpacity(opacity)
+        self.setScreen(screen)
+        self.place(screen.availableGeometry())
+        screen.availableGeometryChanged.connect(self.place)
+
+    def place(self, rect) -> None:
+        height: int = int(0.125 * self._rows * rect.height())
+        self.setFixedSize(rect.width(), height)
+        self.move(rect.left(), rect.top() + 15 * rect.height() // 16 - height)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        # pylint: disable=invalid-name
+        painter: QPainter = QPainter(self)
+        painter.drawPixmap(
+            0, 0, self._cache.pixmap(self.size(), self.devicePixelRatioF())
+        )
+        painter.end()
+
+
+class OverlayManager(QObject):
+    """
+    Keeps an overlay window per screen, follows the screen changes.
+    """
+
+    def __init__(
+        self,
+        label: ElideLabel,
+        title: str,
+        opacity: float,
+        rows: int = 1,
+        follow_mouse: bool = False,
+        logger=None,
+    ) -> None:
+        super().__init__()
+        self._cache: OverlayCache = OverlayCache(label)
+        self._title: str = title
+        self._opacity: float = opacity
+        self._rows: int = rows
+        # Only shows the overlay on the screen with the mouse if it's set
+        self._follow_mouse: bool = follow_mouse
+        self._visible: bool = False
+        self._logger = logger
+        self.windows: t.Dict[QScreen, OverlayWindow] = {}
+
+        app: QGuiApplication = QGuiApplication.instance()
+        for screen in app.screens():
+            self.add_screen(screen)
+        app.screenAdded.connect(self.add_screen)
+        app.screenRemoved.connect(self.remove_screen)
+
+    def add_screen(self, screen: QScreen) -> None:
+        if self._logger:
+            self._logger.info("Overlay added on screen {}", screen.name())
+        self.windows[screen] = OverlayWindow(
+            screen, self._cache, self._title, self._opacity, self._rows
+        )
+        if self._visible:
+            self.show()
+
+    def remove_screen(self, screen: QScreen) -> None:
+        window: t.Optional[OverlayWindow] = self.windows.pop(screen, None)
+        if window is not None:
+            if self._logger:
+                self._logger.info("Overlay removed from {}", screen.name())
+            window.hide()
+            window.deleteLater()
+
+    def show(self) -> None:
+        """Shows the label after it was changed"""
+        self._visible = True
+        self._cache.invalidate()
+        target: t.Optional[QScreen] = None
+        if self._follow_mouse:
+            target = QGuiApplication.screenAt(QCursor.pos())
+        for screen, window in self.windows.items():
+            visible: bool = target is None or screen == target
+            window.setVisible(visible)
+            if visible:
+                window.update()
+
+    def hide(self) -> None:
+        self._visible = False
+        for window in self.windows.values():
+            window.setVisible(False)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:12:40
+# Last Modified Date: 2026-10-19 18:52:12
+
+"""
+Renders the key overlay of a recorded event log into video frames offline.
+
+Usage::
+
+    python -m keypressed.renderer events.jsonl frames/ --fps 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import multiprocessing
+import os
+import shutil
+import sys
+import typing as t
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtGui import QFont, QImage, QPainter
+from PySide6.QtWidgets import QApplication
+
+from keypressed import default_logger
+from keypressed.elide_label import ElideLabel
+from keypressed.event_log import Event, read_events
+from keypressed.key_sequence import KeySequence, replay
+from keypressed.keypressed import Fonts, create_label
+from keypressed.utils import escape_characters
+
+# An overlay state starts at the timestamp and lasts until the next one,
+# an empty text means the overlay is hidden.
+State = t.Tuple[float, str]
+
+_app: t.Optional[QApplication] = None
+_label: t.Optional[ElideLabel] = None
+_opacity: float = 1.0
+
+
+def overlay_states(
+    events: t.Iterable[Event], timeout: int = 3000, font_size: int = 64
+) -> t.List[State]:
+    """
+    Replays the events through a key sequence into overlay states.
+
+    Args:
+        events (Iterable):
+            (timestamp, key) pairs in chronological order
+        timeout (int):
+            milliseconds of idle time before the overlay is hidden
+        font_size (int):
+            the font size of the overlay
+    Returns:
+        A list of (timestamp, text) overlay states.
+    """
+    escaped: t.Iterator[Event] = (
+        (timestamp, escape_characters(key)) for timestamp, key in events
+    )
+    return list(replay(escaped, KeySequence(font_size=font_size // 2), timeout))
+
+
+def _init_worker(
+    size: t.Tuple[int, int],
+    background_color: str,
+    font_color: str,
+    font_name: str,
+    font_size: int,
+    margin: int,
+    opacity: float,
+) -> None:
+    """Creates an offscreen Qt application and the label per process"""
+    # pylint: disable=global-statement
+    global _app, _label, _opacity
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _app = QApplication.instance() or QApplication([])
+    font: QFont = Fonts.font(font_name, font_size)
+    font.setWeight(QFont.Bold)
+    _label = create_label(font, background_color, font_color, margin)
+    _label.setFixedSize(*size)
+    _opacity = opacity
+
+
+def _render_state(text: str, path: Path, image_format: str) -> None:
+    """Renders a single overlay state to a frame file"""
+    image: QImage = QImage(_label.size(), QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    if text:
+        _label.setText(text)
+        painter: QPainter = QPainter(image)
+        painter.setOpacity(_opacity)
+        _label.render(painter, QPoint())
+        painter.end()
+    if image_format == "png":
+        image.save(str(path))
+    else:
+        image = image.convertToFormat(QImage.Format_RGBA8888)
+        path.write_bytes(image.constBits())
+
+
+def _reuse_frame(source: Path, path: Path) -> None:
+    """Links an identical frame, falls back to copying"""
+    if path.exists():
+        path.unlink()
+    try:
+        os.link(source, path)
+    except OSError:
+        shutil.copyfile(source, path)
+
+
+def _render_range(
+    start: int,
+    stop: int,
+    origin: float,
+    fps: int,
+    states: t.List[State],
+    output: Path,
+    image_format: str,
+) -> int:
+    """
+    Renders frames in [start, stop), states must cover the whole range.
+
+    Returns:
+        How many frames were actually rendered.
+    """
+    rendered: int = 0
+    index: int = 0
+    last_text: t.Optional[str] = None
+    last_path: t.Optional[Path] = None
+    blank_path: t.Optional[Path] = None
+    for frame in range(start, stop):
+        moment: float = origin + frame / fps
+        while index + 1 < len(states) and states[index + 1][0] <= moment:
+            index += 1
+        text: str = states[index][1]
+        path: Path = output / f"frame_{frame:06d}.{image_format}"
+        if text == last_text and last_path is not None:
+            _reuse_frame(last_path, path)
+        elif not text and blank_path is not None:
+            _reuse_frame(blank_path, path)
+        else:
+            _render_state(text, path, image_format)
+            rendered += 1
+            if not text:
+                blank_path = path
+        last_text, last_path = text, path
+    return rendered
+
+
+def render(
+    events: t.Iterable[Event],
+    output: Path,
+    fps: int = 30,
+    size: t.Tuple[int, int] = (1920, 135),
+    image_format: str = "png",
+    workers: t.Optional[int] = None,
+    background_color: str = "#202020",
+    font_color: str = "white",
+    font_name: str = "JetBrains Mono Bold Nerd Font Complete",
+    font_size: int = 64,
+    margin: int = 8,
+    opacity: float = 0.5,
+    timeout: int = 3000,
+    origin: t.Optional[float] = None,
+    logger=None,
+) -> int:
+    """
+    Renders the key overlay of the events into a frame sequence.
+
+    The frames are spread across a process pool, every process renders a
+    contiguous range of frames and only renders a frame when the overlay
+    state changed, unchanged frames are hard linked to the previous one.
+
+    Args:
+        events (Iterable):
+            (timestamp, key) pairs in chronological order
+        output (Path):
+            the directory of the frames
+        fps (int):
+            frames per second
+        size (tuple):
+            the width and height of a frame
+        image_format (str):
+            "png" or "rgba" for raw RGBA frames
+        workers (int):
+            the number of processes, defaults to the number of CPUs
+        origin (float):
+            the timestamp of the video start, defaults to the first event
+    Returns:
+        How many frames were written.
+    """
+    logger = logger or default_logger
+    if image_format not in ("png", "rgba"):
+        raise ValueError(f"Unsupported image format: {image_format}")
+    states: t.List[State] = overlay_states(events, timeout, font_size)
+    if not states:
+        return 0
+    output.mkdir(parents=True, exist_ok=True)
+
+    if origin is None:
+        origin = states[0][0]
+    elif origin < states[0][0]:
+        # The overlay is hidden until the first key
+        states.insert(0, (origin, ""))
+    moments: t.List[float] = [moment for moment, _ in states]
+    total: int = math.ceil((moments[-1] - origin) * fps) + 1
+    if total <= 0:
+        return 0
+    workers = workers or os.cpu_count() or 1
+    chunk: int = max(1, math.ceil(total / (workers * 4)))
+    style: t.Tuple = (
+        size,
+        background_color,
+        font_color,
+        font_name,
+        font_size,
+        margin,
+        opacity,
+    )
+    logger.info("Rendering {} frames with {} workers", total, workers)
+
+    rendered: int = 0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=style,
+    ) as executor:
+        futures = []
+        for start in range(0, total, chunk):
+            stop: int = min(start + chunk, total)
+            # Only sends the states overlapping with this range
+            first: int = bisect_right(moments, origin + start / fps) - 1
+            last: int = bisect_right(moments, origin + (stop - 1) / fps)
+            futures.append(
+                executor.submit(
+                    _render_range,
+                    start,
+                    stop,
+                    origin,
+                    fps,
+                    states[first:last],
+                    output,
+                    image_format,
+                )
+            )
+        for future in futures:
+            rendered += future.result()
+    logger.info("{} frames written, {} rendered", total, rendered)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("log", type=Path, help="the recorded event log")
+    parser.add_argument("output", type=Path, help="the frames directory")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=135)
+    parser.add_argument("--format", choices=("png", "rgba"), default="png")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--opacity", type=float, default=0.618)
+    parser.add_argument("--timeout", type=int, default=3000)
+    parser.add_argument("--origin", type=float, default=None)
+    args = parser.parse_args()
+
+    default_logger.remove()
+    default_logger.add(sys.stderr, level="INFO")
+    render(
+        read_events(args.log),
+        args.output,
+        fps=args.fps,
+        size=(args.width, args.height),
+        image_format=args.format,
+        workers=args.workers,
+        opacity=args.opacity,
+        timeout=args.timeout,
+        origin=args.origin,
+    )
+
+
+if __name__ == "__main__":
+    main()
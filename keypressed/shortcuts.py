@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:17:26
+# Last Modified Date: 2026-10-19 18:53:13
+
+"""
+Recognizes shortcuts in the pressed keys and names their commands.
+
+Binding packs are TOML files mapping key sequences to command names, the
+keys of a sequence are separated by whitespaces::
+
+    [bindings]
+    "ctrl+shift+p" = "Command Palette"
+    "d d" = "delete line"
+
+All packs are compiled into an Aho-Corasick automaton, so every pressed key
+advances the matching in constant time no matter how many bindings there
+are. The automaton is cached on disk until a pack is modified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import typing as t
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+
+import toml
+
+from keypressed import default_logger
+from keypressed.key_syms import mod_symbols, special_keys
+
+# Bumps it when the automaton layout changes to invalidate the caches
+_cache_version: int = 1
+_default_cache_dir: Path = Path.home() / ".cache" / "keypressed"
+
+# The canonical order of modifiers
+_modifiers: t.Tuple[str, ...] = ("ctrl", "alt", "shift", "super")
+_modifier_aliases: t.Dict[str, str] = {
+    "control": "ctrl",
+    "option": "alt",
+    "opt": "alt",
+    "cmd": "super",
+    "command": "super",
+    "meta": "super",
+    "win": "super",
+    **{name: name for name in _modifiers},
+}
+# The modifier prefixes emitted by the listener, on every platform
+_modifier_prefixes: t.Dict[str, str] = {
+    symbol: name
+    for name, symbols in mod_symbols.items()
+    for symbol in (*symbols.values(), symbols.default_factory())
+}
+# The special key names used in binding packs, e.g. "enter" or "esc"
+_key_names: t.Dict[str, str] = {
+    key.name: symbol.strip() for key, symbol in special_keys.items()
+}
+
+
+def _canonical(modifiers: t.Set[str], key: str) -> str:
+    """Joins modifiers and key in the canonical form, e.g. "ctrl+shift+p"."""
+    if len(key) > 1 or modifiers - {"shift"}:
+        key = key.lower()
+    elif modifiers == {"shift"} and len(key) == 1 and key.isalpha():
+        # The listener shows Shift+p as P
+        modifiers, key = set(), key.upper()
+    return "+".join([m for m in _modifiers if m in modifiers] + [key])
+
+
+@lru_cache(maxsize=1024)
+def normalize_key(key: str) -> str:
+    """
+    Normalizes a key symbol emitted by the listener.
+
+    Args:
+        key (str):
+            a key symbol like "Ctrl+Shift+p" or "⌘+c"
+    Returns:
+        The canonical form of the key.
+    """
+    modifiers: t.Set[str] = set()
+    stripped: bool = True
+    while stripped:
+        stripped = False
+        for prefix, name in _modifier_prefixes.items():
+            if key.startswith(prefix) and len(key) > len(prefix):
+                modifiers.add(name)
+                key = key[len(prefix) :]
+                stripped = True
+    key = key.strip()
+    if modifiers - {"shift"} and len(key) == 1 and key.isupper():
+        # The listener hides Shift for printable keys, Ctrl+Shift+p is Ctrl+P
+        modifiers.add("shift")
+    return _canonical(modifiers, key)
+
+
+def parse_binding(binding: str) -> t.List[str]:
+    """
+    Parses a binding written in a pack.
+
+    Args:
+        binding (str):
+            keys separated by whitespaces, like "ctrl+k ctrl+c" or "d d"
+    Returns:
+        The canonical forms of the keys.
+    Raises:
+        ValueError: if the binding is empty or has an unknown modifier
+    """
+    keys: t.List[str] = []
+    for chord in binding.split():
+        parts: t.List[str] = chord.split("+")
+        if chord.endswith("+") and len(chord) > 1:
+            # The plus key itself, e.g. "ctrl++"
+            parts = chord[:-2].split("+") + ["+"]
+        *mods, key = parts
+        modifiers: t.Set[str] = set()
+        for mod in mods:
+            if mod.lower() not in _modifier_aliases:
+                raise ValueError(f"Unknown modifier {mod!r} in {binding!r}")
+            modifiers.add(_modifier_aliases[mod.lower()])
+        keys.append(_canonical(modifiers, _key_names.get(key.lower(), key)))
+    if not keys:
+        raise ValueError("Empty binding")
+    return keys
+
+
+class Automaton:
+    """
+    An Aho-Corasick automaton over keys, the state 0 is the root.
+    """
+
+    def __init__(self, bindings: t.Dict[str, str]) -> None:
+        self.goto: t.List[t.Dict[str, int]] = [{}]
+        self.fail: t.List[int] = [0]
+        # The command of the longest binding ending at each state
+        self.output: t.List[t.Optional[str]] = [None]
+
+        for binding, command in bindings.items():
+            state: int = 0
+            for key in parse_binding(binding):
+                if key not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(None)
+                    self.goto[state][key] = len(self.goto) - 1
+                state = self.goto[state][key]
+            self.output[state] = command
+
+        # Breadth first, so the fail state is always built before
+        queue: t.Deque[int] = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for key, child in self.goto[state].items():
+                fallback: int = self.fail[state]
+                while fallback and key not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(key, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+                if self.output[child] is None:
+                    self.output[child] = self.output[self.fail[child]]
+                queue.append(child)
+
+    def __len__(self) -> int:
+        return len(self.goto)
+
+    def step(self, state: int, key: str) -> int:
+        """Follows the fail links until the key can be accepted"""
+        while state and key not in self.goto[state]:
+            state = self.fail[state]
+        return self.goto[state].get(key, 0)
+
+
+class ShortcutMatcher:
+    """
+    Matches the pressed keys against the loaded bindings.
+    """
+
+    def __init__(self, automaton: Automaton, logger=None) -> None:
+        self._automaton: Automaton = automaton
+        self._state: int = 0
+        # Memoizes the transitions, each key costs a dict lookup afterwards
+        self._transitions: t.Dict[t.Tuple[int, str], int] = {}
+        self._logger = logger or default_logger
+
+    @classmethod
+    def load(
+        cls,
+        packs: t.Sequence[Path],
+        cache_dir: t.Optional[Path] = None,
+        logger=None,
+    ) -> ShortcutMatcher:
+        """
+        Loads binding packs, from the compiled cache if it's up to date.
+
+        Args:
+            packs (Sequence):
+                paths of the binding packs
+            cache_dir (Path):
+                where the compiled automatons are cached
+        Returns:
+            A matcher of all bindings in the packs.
+        """
+        logger = logger or default_logger
+        cache_dir = cache_dir or _default_cache_dir
+        digest = hashlib.sha1(str(_cache_version).encode())
+        for pack in packs:
+            stat = pack.stat()
+            digest.update(
+                f"{pack.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+            )
+        cache_file: Path = cache_dir / f"bindings-{digest.hexdigest()}.pickle"
+
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as cache:
+                    automaton: Automaton = pickle.load(cache)
+                logger.debug("Bindings loaded from {}", cache_file)
+                return cls(automaton, logger=logger)
+            except Exception as err:  # pylint: disable=broad-except
+                # A stale or foreign pickle can raise about anything
+                logger.warning(
+                    "Ignoring the broken cache {}: {}", cache_file, err
+                )
+
+        bindings: t.Dict[str, str] = {}
+        for pack in packs:
+            for binding, command in toml.load(pack).get("bindings", {}).items():
+                # A bad binding is skipped instead of failing the whole pack
+                try:
+                    parse_binding(binding)
+                except ValueError as err:
+                    logger.warning("Skipping {} in {}: {}", binding, pack, err)
+                    continue
+                if not isinstance(command, str):
+                    logger.warning(
+                        "Skipping {} in {}: no command", binding, pack
+                    )
+                    continue
+                bindings[binding] = command
+        automaton = Automaton(bindings)
+        logger.info("{} bindings compiled", len(bindings))
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "wb") as cache:
+                pickle.dump(automaton, cache, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as err:
+            logger.warning("Caching the bindings failed: {}", err)
+        return cls(automaton, logger=logger)
+
+    def accept(self, key: str) -> t.Optional[str]:
+        """
+        Advances the matching by a key emitted by the listener.
+
+        Args:
+            key (str):
+                the key symbol
+        Returns:
+            The command of the longest binding ending with this key, if any.
+        """
+        transition: t.Tuple[int, str] = (self._state, normalize_key(key))
+        state: t.Optional[int] = self._transitions.get(transition)
+        if state is None:
+            state = self._automaton.step(*transition)
+            self._transitions[transition] = state
+        command: t.Optional[str] = self._automaton.output[state]
+        # A complete binding consumes its keys, "d d d" deletes a line once
+        if command is not None and not self._automaton.goto[state]:
+            state = 0
+        self._state = state
+        return command
+
+    def reset(self) -> None:
+        self._state = 0
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:37:00
+# Last Modified Date: 2026-10-19 18:53:33
+
+"""
+Runs a recorded or synthetic session through the App on a virtual clock.
+
+The keys go through the Listener, the KeySequence, the label and the real
+timeouts, but the clock jumps straight to the next deadline, so hours of
+typing take seconds. It's meant for performance and memory soak tests.
+
+Usage::
+
+    QT_QPA_PLATFORM=offscreen python -m keypressed.soak --log events.jsonl
+    QT_QPA_PLATFORM=offscreen python -m keypressed.soak --hours 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import time
+import tracemalloc
+import typing as t
+from pathlib import Path
+
+from keypressed import default_logger
+from keypressed.clock import VirtualClock
+from keypressed.event_log import Event, read_events
+from keypressed.keypressed import App
+from keypressed.listener import Listener
+
+_logo: Path = Path(__file__).parent.parent / "assets/imgs/logo.png"
+
+
+def synthetic_events(
+    hours: float, wpm: int = 60, seed: int = 0
+) -> t.Iterator[Event]:
+    """
+    Generates bursts of typing separated by pauses.
+
+    Args:
+        hours (float):
+            how long the session lasts
+        wpm (int):
+            the typing speed of a burst, in words (5 keys) per minute
+        seed (int):
+            the seed of the random generator
+    Returns:
+        An iterator of (timestamp, key) pairs.
+    """
+    rng: random.Random = random.Random(seed)
+    keys: str = string.ascii_lowercase + string.digits + " "
+    gap: float = 60 / (wpm * 5)
+    timestamp: float = 0
+    end: float = hours * 3600
+    while timestamp < end:
+        for _ in range(rng.randint(1, 80)):
+            timestamp += rng.expovariate(1 / gap)
+            yield timestamp, rng.choice(keys)
+        timestamp += rng.uniform(0.5, 30)
+
+
+def soak(app: App, clock: VirtualClock, events: t.Iterable[Event]) -> int:
+    """
+    Replays the events through the App until every timeout was handled.
+
+    Args:
+        app (App):
+            an App created with the clock
+        clock (VirtualClock):
+            the clock of the App
+        events (Iterable):
+            (timestamp, key) pairs in chronological order
+    Returns:
+        The number of callbacks run by the clock.
+    Raises:
+        ValueError: if the App is in aggregate mode
+    """
+    if not isinstance(app.listener, Listener):
+        raise ValueError("Soak tests can't run in aggregate mode")
+    app.listener.replay(events)
+    count: int = clock.run()
+    # Handles the posted events like the deferred deletes
+    app.processEvents()
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--log", type=Path, help="a recorded event log")
+    source.add_argument("--hours", type=float, help="a synthetic session")
+    parser.add_argument("--wpm", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=int, default=3000)
+    parser.add_argument("--history", type=int, default=0)
+    parser.add_argument("--bindings", type=Path, nargs="*", default=())
+    parser.add_argument(
+        "--trace-memory", action="store_true", help="reports the peak memory"
+    )
+    args = parser.parse_args()
+
+    default_logger.remove()
+    default_logger.add(sys.stderr, level="INFO")
+    if args.trace_memory:
+        tracemalloc.start()
+    clock: VirtualClock = VirtualClock()
+    app: App = App(
+        _logo,
+        show_mouse=False,
+        timeout=args.timeout,
+        binding_packs=args.bindings,
+        history_size=args.history,
+        clock=clock,
+    )
+    events: t.Iterable[Event] = (
+        read_events(args.log)
+        if args.log
+        else synthetic_events(args.hours, wpm=args.wpm, seed=args.seed)
+    )
+    started: float = time.perf_counter()
+    count: int = soak(app, clock, events)
+    elapsed: float = time.perf_counter() - started
+    default_logger.info(
+        "{:.0f}s of virtual time, {} callbacks, in {:.1f}s",
+        clock.now(),
+        count,
+        elapsed,
+    )
+    if args.trace_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        default_logger.info(
+            "Memory: {:.1f} MiB, peak {:.1f} MiB", current / 2**20, peak / 2**20
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:14:31
+# Last Modified Date: 2026-10-19 18:52:35
+
+"""
+Exports the key overlay of a recorded event log as a subtitle track.
+
+Usage::
+
+    python -m keypressed.subtitles events.jsonl keys.ass
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import typing as t
+from pathlib import Path
+
+from keypressed import default_logger
+from keypressed.event_log import Event, read_events
+from keypressed.key_sequence import KeySequence, replay
+
+# A subtitle event, the start and end seconds and the text
+Cue = t.Tuple[float, float, str]
+
+_ass_header: str = """[Script Info]
+ScriptType: v4.00+
+WrapStyle: 2
+ScaledBorderAndShadow: yes
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, \
+OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, \
+ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, \
+MarginR, MarginV, Encoding
+Style: Keys,{font_name},{font_size},{font_color},{font_color},\
+{background_color},{background_color},-1,0,0,0,100,100,0,0,3,{margin},0,2,\
+10,10,{margin_v},1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
+class PlainKeySequence(KeySequence):
+    """
+    A key sequence rendered as plain text instead of rich text.
+
+    When max_keys is given and older keys were dropped, the text starts with
+    "..." like the elided overlay.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._elided: bool = False
+
+    def __str__(self) -> str:
+        text: str = super().__str__()
+        return f"...{text}" if self._elided else text
+
+    def append_item(self, item: str) -> None:
+        if len(self._sequence) == self._sequence.maxlen:
+            self._elided = True
+        super().append_item(item)
+
+    def clear(self) -> None:
+        super().clear()
+        self._elided = False
+
+    def additional_text(self, size: int, num: int) -> str:
+        return f"...{num}x "
+
+    def pattern_text(self, size: int, pattern: str, num: int) -> str:
+        return f" ({pattern})\u00d7{num} "
+
+
+def cues(
+    events: t.Iterable[Event],
+    timeout: int = 3000,
+    max_same_key: int = 3,
+    max_keys: int = 64,
+    origin: t.Optional[float] = None,
+) -> t.Iterator[Cue]:
+    """
+    Turns the events into subtitle cues, one cue per shown key sequence.
+
+    The events are consumed lazily and only the last max_keys keys of a
+    sequence are kept, so the memory usage doesn't depend on the log size.
+
+    Args:
+        events (Iterable):
+            (timestamp, key) pairs in chronological order
+        timeout (int):
+            milliseconds of idle time before the sequence is cleared
+        max_same_key (int):
+            how many same keys are shown before "...Nx"
+        max_keys (int):
+            how many keys a cue shows at most
+        origin (float):
+            the timestamp of the video start, defaults to the first event
+    Returns:
+        An iterator of (start, end, text) cues.
+    """
+    sequence: PlainKeySequence = PlainKeySequence(
+        max_same_key=max_same_key, max_keys=max_keys
+    )
+    previous: t.Optional[t.Tuple[float, str]] = None
+    for timestamp, text in replay(events, sequence, timeout):
+        if origin is None:
+            origin = timestamp
+        if previous is not None and previous[1]:
+            yield previous[0] - origin, timestamp - origin, previous[1]
+        previous = (timestamp, text)
+
+
+def _srt_time(seconds: float) -> str:
+    millis: int = max(0, round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def _ass_time(seconds: float) -> str:
+    centis: int = max(0, round(seconds * 100))
+    hours, centis = divmod(centis, 360_000)
+    minutes, centis = divmod(centis, 6000)
+    secs, centis = divmod(centis, 100)
+    return f"{hours:d}:{minutes:02d}:{secs:02d}.{centis:02d}"
+
+
+def _ass_color(color: str, opacity: float = 1.0) -> str:
+    """Converts "#rrggbb" into the "&HAABBGGRR" ASS color"""
+    red, green, blue = color[1:3], color[3:5], color[5:7]
+    alpha: int = round((1 - opacity) * 255)
+    return f"&H{alpha:02X}{blue}{green}{red}".upper()
+
+
+def _ass_escape(text: str) -> str:
+    """Keeps braces and backslashes from being parsed as override tags"""
+    return (
+        text.replace("\\", "\\\u2060").replace("{", "\\{").replace("}", "\\}")
+    )
+
+
+def write_srt(cue_iter: t.Iterable[Cue], output: t.TextIO) -> int:
+    """
+    Writes the cues as a SubRip track.
+
+    Returns:
+        How many cues were written.
+    """
+    count: int = 0
+    for count, (start, end, text) in enumerate(cue_iter, start=1):
+        output.write(
+            f"{count}\n{_srt_time(start)} --> {_srt_time(end)}\n{text}\n\n"
+        )
+    return count
+
+
+def write_ass(
+    cue_iter: t.Iterable[Cue],
+    output: t.TextIO,
+    background_color: str = "#202020",
+    font_color: str = "#ffffff",
+    font_name: str = "JetBrains Mono",
+    font_size: int = 64,
+    margin: int = 8,
+    opacity: float = 0.5,
+) -> int:
+    """
+    Writes the cues as an Advanced SubStation Alpha track.
+
+    The style mirrors the overlay, editors can restyle the "Keys" style.
+
+    Returns:
+        How many cues were written.
+    """
+    output.write(
+        _ass_header.format(
+            font_name=font_name,
+            font_size=font_size,
+            font_color=_ass_color(font_color),
+            background_color=_ass_color(background_color, opacity),
+            margin=margin,
+            margin_v=font_size,
+        )
+    )
+    count: int = 0
+    for count, (start, end, text) in enumerate(cue_iter, start=1):
+        output.write(
+            f"Dialogue: 0,{_ass_time(start)},{_ass_time(end)},Keys,,0,0,0,,"
+            f"{_ass_escape(text)}\n"
+        )
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("log", type=Path, help="the recorded event log")
+    parser.add_argument("output", type=Path, help="a .srt or .ass file")
+    parser.add_argument("--timeout", type=int, default=3000)
+    parser.add_argument("--max-same-key", type=int, default=3)
+    parser.add_argument(
+        "--max-keys",
+        type=int,
+        default=64,
+        help='the older keys of a longer cue are elided into "..."',
+    )
+    parser.add_argument("--origin", type=float, default=None)
+    args = parser.parse_args()
+
+    default_logger.remove()
+    default_logger.add(sys.stderr, level="INFO")
+    cue_iter: t.Iterator[Cue] = cues(
+        read_events(args.log),
+        timeout=args.timeout,
+        max_same_key=args.max_same_key,
+        max_keys=args.max_keys,
+        origin=args.origin,
+    )
+    with open(args.output, "w", encoding="utf-8") as output:
+        if args.output.suffix.lower() == ".ass":
+            count: int = write_ass(cue_iter, output)
+        else:
+            count = write_srt(cue_iter, output)
+    default_logger.info("{} subtitles written to {}", count, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:32:23
+# Last Modified Date: 2026-10-19 18:53:33
+
+"""
+A logging facade with an in-memory flight recorder.
+
+Messages are formatted only if their level is enabled, so the hot paths pass
+the arguments instead of building f-strings. Besides, every pressed key leaves
+a tiny structured record in a fixed-size ring, which costs a tuple and a deque
+append. The ring is dumped to disk on demand, on crash or on a detected stall,
+so there is a debug trace even if the application runs at INFO level.
+
+The records always go to the flight recorder of keypressed.default_logger,
+whatever logger was given to a class, so a plain loguru logger still works.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+import typing as t
+from collections import deque
+from pathlib import Path
+
+Record = t.Tuple[float, str, t.Tuple[t.Any, ...]]
+
+_default_dump_dir: Path = Path.home() / ".cache" / "keypressed" / "traces"
+
+
+class Logger:
+    """
+    Wraps a loguru logger, anything not defined here is delegated to it.
+
+    Args:
+        logger:
+            the wrapped loguru logger
+        capacity (int):
+            the number of records kept in the flight recorder
+        seconds (float):
+            how many seconds of records a dump covers by default
+        dump_dir (Path):
+            where the dumps are written
+    """
+
+    def __init__(
+        self,
+        logger,
+        capacity: int = 1 << 16,
+        seconds: float = 60,
+        dump_dir: t.Optional[Path] = None,
+    ) -> None:
+        self._logger = logger
+        self._ring: t.Deque[Record] = deque(maxlen=capacity)
+        self.seconds: float = seconds
+        self.dump_dir: Path = dump_dir or _default_dump_dir
+        self._min_level: int = 0
+        self.refresh_level()
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._logger, name)
+
+    def refresh_level(self) -> None:
+        """Caches the lowest level enabled by the sinks"""
+        # loguru doesn't expose it publicly, falls back to log everything
+        self._min_level = getattr(
+            getattr(self._logger, "_core", None), "min_level", 0
+        )
+
+    def add(self, *args, **kwargs) -> int:
+        handler_id: int = self._logger.add(*args, **kwargs)
+        self.refresh_level()
+        return handler_id
+
+    def remove(self, *args, **kwargs) -> None:
+        self._logger.remove(*args, **kwargs)
+        self.refresh_level()
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        if self._min_level <= 10:
+            self._logger.opt(depth=1).debug(message, *args, **kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        if self._min_level <= 20:
+            self._logger.opt(depth=1).info(message, *args, **kwargs)
+
+    def warning(self, message: str, *args, **kwargs) -> None:
+        if self._min_level <= 30:
+            self._logger.opt(depth=1).warning(message, *args, **kwargs)
+
+    def error(self, message: str, *args, **kwargs) -> None:
+        self._logger.opt(depth=1).error(message, *args, **kwargs)
+
+    def exception(self, message: str, *args, **kwargs) -> None:
+        self._logger.opt(depth=1, exception=True).error(
+            message, *args, **kwargs
+        )
+
+    def record(self, event: str, *values: t.Any) -> None:
+        """
+        Appends a record to the flight recorder.
+
+        The values are kept as they are and serialized only by a dump, so they
+        shouldn't be mutated afterwards.
+
+        Args:
+            event (str):
+                the name of the event
+            values:
+                the fields of the event
+        """
+        self._ring.append((time.time(), event, values))
+
+    def records(self, seconds: t.Optional[float] = None) -> t.List[Record]:
+        """
+        Gets the records of the last seconds.
+
+        Args:
+            seconds (float):
+                defaults to the seconds of the logger
+        Returns:
+            The records, the oldest first.
+        """
+        # Copying a deque doesn't release the GIL, so it's safe here
+        records: t.List[Record] = list(self._ring)
+        since: float = time.time() - (seconds or self.seconds)
+        start: int = len(records)
+        while start > 0 and records[start - 1][0] >= since:
+            start -= 1
+        return records[start:]
+
+    def dump(
+        self,
+        reason: str = "manual",
+        path: t.Optional[Path] = None,
+        seconds: t.Optional[float] = None,
+    ) -> t.Optional[Path]:
+        """
+        Writes the records of the last seconds to a JSON lines file.
+
+        Args:
+            reason (str):
+                why the dump is written, a part of the default file name
+            path (Path):
+                defaults to a new file in the dump directory
+            seconds (float):
+                defaults to the seconds of the logger
+        Returns:
+            The path of the dump, or None if it can't be written.
+        """
+        if path is None:
+            stamp: str = time.strftime("%Y%m%d-%H%M%S")
+            path = self.dump_dir / f"trace-{stamp}-{reason}.jsonl"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as fp:
+                for timestamp, event, values in self.records(seconds):
+                    fp.write(
+                        json.dumps(
+                            {"ts": timestamp, "event": event, "values": values},
+                            ensure_ascii=False,
+                            default=str,
+                        )
+                    )
+                    fp.write("\n")
+        except OSError as err:
+            self._logger.warning("Dumping the flight recorder failed: {}", err)
+            return None
+        self._logger.info("Flight recorder dumped to {}", path)
+        return path
+
+    def install_crash_handler(self) -> None:
+        """Dumps the flight recorder before an uncaught exception is reported"""
+        excepthook = sys.excepthook
+        threading_excepthook = threading.excepthook
+
+        def on_crash(*args) -> None:
+            self.dump("crash")
+            excepthook(*args)
+
+        def on_thread_crash(args) -> None:
+            self.dump("crash")
+            threading_excepthook(args)
+
+        sys.excepthook = on_crash
+        threading.excepthook = on_thread_crash
+
+
+class Watchdog:
+    """
+    Dumps the flight recorder if the beats stop for longer than a threshold.
+
+    The beats should come from the thread being watched, e.g. a timer of the
+    Qt event loop. A stall is dumped once, until the beats resume.
+
+    Args:
+        logger (Logger):
+            the logger which owns the flight recorder
+        threshold (float):
+            the seconds without a beat to be considered as a stall
+    """
+
+    def __init__(self, logger: Logger, threshold: float = 2) -> None:
+        self._logger: Logger = logger
+        self._threshold: float = threshold
+        self._last_beat: float = time.monotonic()
+        self._stalled: bool = False
+        self._stopped: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name="keypressed-watchdog", daemon=True
+        )
+
+    def start(self) -> None:
+        self._last_beat = time.monotonic()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def beat(self) -> None:
+        self._last_beat = time.monotonic()
+        self._stalled = False
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._threshold / 4):
+            elapsed: float = time.monotonic() - self._last_beat
+            if elapsed > self._threshold and not self._stalled:
+                self._stalled = True
+                self._logger.warning("Stalled for {:.1f}s", elapsed)
+                self._logger.record("stall", elapsed)
+                self._logger.dump("stall")
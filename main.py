@@ -26,7 +26,7 @@
 # Author:             Pagliacii
 # Last Modified By:   Pagliacii
 # Created Date:       2021-03-17 22:53:07
-# Last Modified Date: 2021-08-04 17:37:12
+# Last Modified Date: 2026-10-19 18:42:40
 
 """
 The entry point of this application.
@@ -35,17 +35,73 @@ The entry point of this application.
 from __future__ import annotations
 
 import os
+import signal
 import sys
+import typing as t
 from pathlib import Path
 
-from loguru import logger
-
+from keypressed import default_logger as logger
 from keypressed.keypressed import App
 
 logo: Path = Path(__file__).parent / "assets/imgs/logo.png"
 logger.remove(0)
 logger.add(sys.stdout, level=(os.getenv("KPLOG_LEVEL") or "INFO").upper())
 logger.add(sys.stderr, level="WARNING")
-app: App = App(logo_file=logo, logger=logger, opacity=0.618)
+# The flight recorder is dumped to ~/.cache/keypressed/traces on crash, on a
+# stall, from the tray menu or by sending SIGUSR1
+logger.install_crash_handler()
+if hasattr(signal, "SIGUSR1"):
+    signal.signal(signal.SIGUSR1, lambda *_: logger.dump())
+
+# Network mode, KP_PUBLISH="host:port" sends the pressed keys to an aggregator,
+# KP_AGGREGATE="port" shows the keys received from all publishers.
+publish_to: t.Optional[t.Tuple[str, int]] = None
+if publish := os.getenv("KP_PUBLISH"):
+    publish_host, _, publish_port = publish.rpartition(":")
+    publish_to = (publish_host, int(publish_port))
+aggregate_on: t.Optional[int] = None
+if aggregate := os.getenv("KP_AGGREGATE"):
+    aggregate_on = int(aggregate)
+# KP_RECORD="path" appends the pressed keys to an event log, which can be
+# rendered into video frames later by `python -m keypressed.renderer`.
+record_to: t.Optional[Path] = None
+if record := os.getenv("KP_RECORD"):
+    record_to = Path(record)
+# KP_INCLUDE_APPS and KP_EXCLUDE_APPS are comma separated glob patterns of the
+# applications whose keys are shown or hidden, e.g. "keepass*,*terminal*".
+include_apps: t.List[str] = list(
+    filter(None, os.getenv("KP_INCLUDE_APPS", "").split(","))
+)
+exclude_apps: t.List[str] = list(
+    filter(None, os.getenv("KP_EXCLUDE_APPS", "").split(","))
+)
+# KP_BINDINGS is a list of binding pack files, separated by os.pathsep
+binding_packs: t.List[Path] = [
+    Path(pack)
+    for pack in os.getenv("KP_BINDINGS", "").split(os.pathsep)
+    if pack
+]
+# KP_HISTORY="N" keeps the last N key sequences in a history panel
+history_size: int = int(os.getenv("KP_HISTORY") or 0)
+# KP_MOUSE=1 shows the mouse clicks and scroll steps too
+show_mouse: bool = bool(os.getenv("KP_MOUSE"))
+# KP_SCREENS is "primary" (default), "all" or "mouse"
+screens: str = os.getenv("KP_SCREENS") or "primary"
+
+app: App = App(
+    logo_file=logo,
+    logger=logger,
+    opacity=0.618,
+    publish_to=publish_to,
+    aggregate_on=aggregate_on,
+    compress=bool(os.getenv("KP_COMPRESS")),
+    record_to=record_to,
+    include_apps=include_apps,
+    exclude_apps=exclude_apps,
+    binding_packs=binding_packs,
+    history_size=history_size,
+    screens=screens,
+    show_mouse=show_mouse,
+)
 app.run()
 sys.exit(app.exec())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:44:13
+# Last Modified Date: 2026-10-19 18:53:30
+
+"""Tests the repeated pattern collapsing of KeySequence."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from keypressed.key_sequence import CLEAR, Edit, KeySequence
+from keypressed.subtitles import PlainKeySequence
+
+
+def typed(keys: str, **kwargs: t.Any) -> str:
+    sequence: KeySequence = PlainKeySequence(**kwargs)
+    for key in keys:
+        sequence.accept(key)
+    return str(sequence)
+
+
+@pytest.mark.parametrize(
+    "keys, expected",
+    [
+        ("jkjk", "jkjk"),
+        ("jkjkjk", "(jk)×3"),
+        ("jkjkjkjk", "(jk)×4"),
+        ("abcabcabc", "(abc)×3"),
+        ("aabaabaab", "(aab)×3"),
+    ],
+)
+def test_patterns(keys: str, expected: str) -> None:
+    assert typed(keys) == expected
+
+
+def test_partial_repetition_is_kept() -> None:
+    assert typed("jkjkjkj") == "(jk)×3 j"
+    assert typed("jkjkjkjx") == "(jk)×3 jx"
+    assert typed("jkjkjkjkjx") == "(jk)×4 jx"
+
+
+def test_runs_of_one_key_are_not_patterns() -> None:
+    assert typed("j" * 8, max_same_key=10) == "j" * 8
+    assert typed("j" * 12, max_same_key=10) == "j" * 10 + "...12x"
+
+
+def apply(items: t.List[str], edits: t.List[Edit]) -> None:
+    """Applies the edits like the overlay label does"""
+    for removed, item in edits:
+        if removed == CLEAR:
+            items.clear()
+        elif removed:
+            del items[-removed:]
+        if item:
+            items.append(item)
+
+
+@pytest.mark.parametrize(
+    "keys, expected",
+    [
+        ("jkjkjkjxjkjkjkjk", "(jk)×3 jx (jk)×4"),
+        ("abcabcabcabxabcabcabc", "(abc)×3 abx (abc)×3"),
+    ],
+)
+def test_edits_follow_break_and_resume(keys: str, expected: str) -> None:
+    sequence: KeySequence = PlainKeySequence(track_edits=True)
+    items: t.List[str] = []
+    for key in keys:
+        sequence.accept(key)
+        apply(items, sequence.take_edits())
+        assert "".join(items).strip() == str(sequence)
+    assert str(sequence) == expected
+    sequence.clear()
+    apply(items, sequence.take_edits())
+    assert items == []
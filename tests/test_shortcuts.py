@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2021 Pagliacii
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Author:             Pagliacii
+# Last Modified By:   Pagliacii
+# Created Date:       2026-10-19 18:53:13
+# Last Modified Date: 2026-10-19 18:53:13
+
+"""Tests the binding packs and the shortcut matching."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from keypressed.shortcuts import ShortcutMatcher, normalize_key, parse_binding
+
+PACK: str = """
+[bindings]
+"ctrl+shift+p" = "Command Palette"
+"d d" = "delete line"
+"+" = "broken"
+"ctrl+k ctrl+c" = "comment"
+"""
+
+
+def load(tmp_path: Path) -> ShortcutMatcher:
+    pack: Path = tmp_path / "pack.toml"
+    pack.write_text(PACK, encoding="utf-8")
+    return ShortcutMatcher.load([pack], cache_dir=tmp_path / "cache")
+
+
+def test_shift_hidden_by_the_listener() -> None:
+    assert normalize_key("Ctrl+P") == parse_binding("ctrl+shift+p")[0]
+    assert normalize_key("Ctrl+p") == "ctrl+p"
+    assert normalize_key("P") == "P"
+
+
+def test_bad_bindings_are_skipped(tmp_path: Path) -> None:
+    matcher: ShortcutMatcher = load(tmp_path)
+    assert matcher.accept("Ctrl+P") == "Command Palette"
+    assert matcher.accept("d") is None
+    assert matcher.accept("d") == "delete line"
+
+
+def test_broken_cache_is_a_miss(tmp_path: Path) -> None:
+    load(tmp_path)
+    for cache in (tmp_path / "cache").iterdir():
+        # Unpickling it imports a module which doesn't exist
+        cache.write_bytes(b"cmissing_module\nAutomaton\n.")
+    matcher: ShortcutMatcher = load(tmp_path)
+    assert matcher.accept("Ctrl+P") == "Command Palette"